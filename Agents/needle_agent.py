@@ -41,6 +41,10 @@ class NeedleAgent:
         self.embedding_model = config.EMBEDDING_MODEL
         self.llm_model = config.SUMMARY_MODEL
         
+        # Re-raise API errors instead of returning fallback results (the evaluator
+        # sets this so it can retry rate limits and never caches a fallback)
+        self.raise_errors = False
+        
         # Initialize Supabase client
         supabase_url = os.getenv("SUPABASE_URL")
         supabase_key = os.getenv("SUPABASE_KEY")
@@ -167,6 +171,8 @@ class NeedleAgent:
             
         except Exception as e:
             print(f"[ERROR] Failed to search chunks: {e}")
+            if self.raise_errors:
+                raise
             import traceback
             traceback.print_exc()
             return []
@@ -336,6 +342,8 @@ Answer:"""
             
         except Exception as e:
             print(f"[ERROR] Failed to generate answer: {e}")
+            if self.raise_errors:
+                raise
             return {
                 "answer": "An error occurred while generating the answer.",
                 "sources": sources,
@@ -38,6 +38,10 @@ class SummaryAgent:
         self.embedding_model = config.EMBEDDING_MODEL
         self.llm_model = config.SUMMARY_MODEL
         
+        # Re-raise API errors instead of returning fallback results (the evaluator
+        # sets this so it can retry rate limits and never caches a fallback)
+        self.raise_errors = False
+        
         # Initialize Supabase client
         supabase_url = os.getenv("SUPABASE_URL")
         supabase_key = os.getenv("SUPABASE_KEY")
@@ -153,6 +157,8 @@ class SummaryAgent:
             
         except Exception as e:
             print(f"[ERROR] Failed to search summaries: {e}")
+            if self.raise_errors:
+                raise
             import traceback
             traceback.print_exc()
             return []
@@ -251,6 +257,8 @@ Answer:"""
             
         except Exception as e:
             print(f"[ERROR] Failed to generate answer: {e}")
+            if self.raise_errors:
+                raise
             return {
                 "answer": "An error occurred while generating the answer.",
                 "sources": sources,
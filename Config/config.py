@@ -45,13 +45,16 @@ SUMMARY_TOP_K = 6  # Total summaries to retrieve (Overview + top ranked detail p
 # OpenAI Model Configuration
 EMBEDDING_MODEL = "text-embedding-3-small"  # 1536 dimensions
 EMBEDDING_DIMENSIONS = 1536
+EMBEDDING_BATCH_SIZE = 256  # Texts per embeddings request when indexing (API limit: 2048)
+EMBEDDING_MAX_WORKERS = 4  # Embedding batch requests sent concurrently when indexing
+CHUNK_UPSERT_BATCH_SIZE = 100  # Chunk rows sent per Supabase REST upsert request when indexing
 SUMMARY_MODEL = "gpt-4o-mini"  # For generating summaries
 TEMPERATURE = 0.1  # Low temperature for consistent summaries
 
 # File Paths
 DATA_DIR = "Data"
-PDF_PATH = os.path.join(DATA_DIR, "insurance_claim.pdf")  # 10 pages
-METADATA_PATH = os.path.join(DATA_DIR, "claim_metadata.json")  # 10 pages
+PDF_PATH = os.path.join(DATA_DIR, "insurance_claim.pdf")  # 13 pages
+METADATA_PATH = os.path.join(DATA_DIR, "claim_metadata.json")  # 13 pages
 DOCSTORE_PATH = os.path.join("Indexing", "docstore.json")  # Local document store for parent nodes
 
 # Supabase Table Names
@@ -78,12 +81,55 @@ def get_postgres_connection_string():
 # Index Names (stored in Indexing folder)
 NEEDLE_INDEX_PATH = os.path.join("Indexing", "needle_index")  # For needle-in-a-haystack retrieval
 SUMMARY_INDEX_PATH = os.path.join("Indexing", "summary_index")
+EMBEDDING_CACHE_PATH = os.path.join("Indexing", ".cache", "embeddings.sqlite")  # Chunk embeddings reused across re-indexing runs
+PDF_CACHE_DIR = os.path.join("Indexing", ".cache", "pdf")  # Extracted PDF pages, keyed by PDF size and mtime
+PARALLEL_INDEXING = os.getenv("PARALLEL_INDEXING") == "1"  # Build needle and summary indexes concurrently (2 DB connections at once)
+CHUNKING_PROCESSES = int(os.getenv("CHUNKING_PROCESSES", "1"))  # Worker processes for needle chunking (1 = in-process; the 13-page claim PDF is faster in-process, raise for PDFs with hundreds of pages)
 
 # RAGAS Evaluation Paths
 EVALUATION_DIR = "Evaluation"
-QUERY_RESULTS_PATH = os.path.join(EVALUATION_DIR, "query_results.json")
+QUERY_RESULTS_PATH = os.path.join(EVALUATION_DIR, "query_results.jsonl")  # Header line, then one test case per line
 EVALUATION_RESULTS_PATH = os.path.join(EVALUATION_DIR, "evaluation_results.json")
 EVALUATION_REPORT_PATH = os.path.join(EVALUATION_DIR, "evaluation_report.pdf")
+EVALUATION_CACHE_PATH = os.path.join(EVALUATION_DIR, ".cache", "evaluation_cache.json")
+SKIP_ROUTING = False  # Evaluation only: use the dataset's query_type instead of calling the routing agent
+RESULTS_ZSTD_LEVEL = 3  # zstd level for evaluation_results.json.zst (--uncompressed writes plain JSON)
+
+# Semantic Cache (reuse agent results for near-duplicate questions)
+SEMANTIC_CACHE_ENABLED = False  # Opt-in: a near-duplicate's answer and contexts are scored as this question's
+SEMANTIC_CACHE_THRESHOLD = 0.97  # Minimum cosine similarity to reuse a previous answer
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"  # Local fastembed model
+SEMANTIC_CACHE_DIM = 384  # Embedding dimension of SEMANTIC_CACHE_MODEL
+SEMANTIC_CACHE_INDEX_PATH = os.path.join(EVALUATION_DIR, ".cache", "semantic_index.bin")
+SEMANTIC_CACHE_ENTRIES_PATH = os.path.join(EVALUATION_DIR, ".cache", "semantic_entries.json")
+
+# RAGAS Evaluation Concurrency
+EVALUATION_MAX_WORKERS = 8  # Test queries run in parallel (I/O-bound OpenAI/Supabase calls)
+EVALUATION_MAX_CONCURRENT_QUERIES = 8  # Cap on in-flight queries (keep within provider rate limits)
+QUERY_MAX_RETRIES = 3  # Retries per agent call when OpenAI answers 429 (rate limited)
+QUERY_RETRY_BACKOFF = 2.0  # Seconds before the first retry; doubles on each attempt
+RAGAS_MAX_WORKERS = 16  # Concurrent Gemini judge calls across metrics and rows
+RAGAS_EMBEDDING_MODEL = "text-embedding-ada-002"  # RAGAS' default; keeps similarity scores comparable
+RAGAS_TIMEOUT = 180  # Seconds before a single judge call is abandoned
+RAGAS_MAX_RETRIES = 3  # Retries per judge call on transient failures
+QGEN_MODEL = "gpt-4.1-nano"  # Question generator model (structured extraction; use "gpt-4o-mini" for richer questions)
+QGEN_MAX_PAGE_CHARS = 4000  # Safety cap on page content in question-generation prompts (longest claim page: ~3000 chars)
+QGEN_MAX_TOKENS_PER_PAGE = 600  # Output token cap per page in a question-generation request
+QGEN_INPUT_COST_PER_1M = 0.10  # USD per 1M input tokens for QGEN_MODEL (gpt-4o-mini: 0.15)
+QGEN_OUTPUT_COST_PER_1M = 0.40  # USD per 1M output tokens for QGEN_MODEL (gpt-4o-mini: 0.60)
+QUESTION_GEN_MAX_WORKERS = 8  # Pages sent to OpenAI concurrently when generating test questions
+QUESTION_BATCH_POLL_INTERVAL = 30  # Seconds between status checks of a question_generator --batch job
+QUESTION_GEN_MAX_RETRIES = 5  # Retries per question_generator request on 429/5xx/connection errors/timeouts
+QUESTION_GEN_RETRY_BACKOFF = 2.0  # Seconds before the first retry; doubles on each attempt
+QUESTION_GEN_MAX_BACKOFF = 60.0  # Upper bound on a single retry wait (also caps retry-after)
+QUESTION_CACHE_DIR = os.path.join(EVALUATION_DIR, ".cache", "llm")  # One JSON file per question_generator completion
+QUESTION_CACHE_MAX_TEMPERATURE = 0.7  # Completions sampled hotter than this are not cached
+QUESTION_PDF_CACHE_DIR = os.path.join(EVALUATION_DIR, ".cache", "pdf")  # Parsed pages, keyed by PDF/metadata mtimes
+
+# Local LLM for question_generator (OpenAI-compatible server, e.g. vLLM, Ollama, LM Studio)
+# Reference deployment: vllm serve Qwen/Qwen2.5-7B-Instruct --port 8000
+LOCAL_LLM_URL = os.getenv("LOCAL_LLM_URL")  # e.g. http://localhost:8000/v1; unset = use OpenAI
+LOCAL_QGEN_MODEL = os.getenv("LOCAL_QGEN_MODEL", "Qwen/Qwen2.5-7B-Instruct")  # Model name served at LOCAL_LLM_URL
 
 # QA Testing Suite Configuration
 QA_DIR = "QA"
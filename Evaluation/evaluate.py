@@ -5,91 +5,642 @@ This module runs comprehensive RAGAS evaluation on the RAG system using
 Gemini as the LLM judge for all metrics.
 """
 
+import argparse
+import bisect
+import io
 import json
 import os
 import sys
+import threading
+import time
+import warnings
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Tuple
+
+import numpy as np
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from Config import config
-from Agents.routing_agent import RoutingAgent
-from Agents.needle_agent import NeedleAgent
-from Agents.summary_agent import SummaryAgent
-
-# RAGAS imports
-from datasets import Dataset
-from ragas import evaluate
-from ragas.metrics import (
-    context_precision,
-    context_recall,
-    faithfulness,
-    answer_relevancy,
-    answer_similarity,
-    answer_correctness
-)
-from langchain_google_genai import ChatGoogleGenerativeAI
-
-# PDF generation
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from Evaluation.evaluation_cache import EvaluationCache
+from Evaluation.semantic_cache import SemanticCache
+
+# Agents, RAGAS, LangChain and ReportLab are imported where they are used so
+# that loading this module (e.g. just to regenerate the PDF) stays fast
+if TYPE_CHECKING:
+    from ragas.llms import LangchainLLMWrapper
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+# Answer recorded for a test whose routing or agent call failed (never cached)
+AGENT_ERROR_ANSWER = "An error occurred while generating the answer."
+
+# RAGAS metric columns, in report order
+METRIC_NAMES = ['context_precision', 'context_recall', 'faithfulness',
+                'answer_relevancy', 'answer_similarity', 'answer_correctness']
+METRIC_LABELS = {
+    'context_precision': 'Context Precision',
+    'context_recall': 'Context Recall',
+    'faithfulness': 'Faithfulness',
+    'answer_relevancy': 'Answer Relevancy',
+    'answer_similarity': 'Answer Similarity',
+    'answer_correctness': 'Answer Correctness'
+}
+
+
+# Per-test fields carried from query collection through reporting
+EVAL_FIELDS = ('test_id', 'question', 'answer', 'contexts', 'ground_truth',
+               'query_type', 'routed_type', 'expected_chunks', 'retrieved_chunk_ids')
+
+# Columns RAGAS reads from the evaluation dataset
+RAGAS_FIELDS = ('question', 'answer', 'contexts', 'ground_truth')
+
+
+def _is_missing(value: Any) -> bool:
+    """Return True for None or NaN (NaN is the only value not equal to itself)."""
+    return value is None or value != value
+
+
+def _safe_float(value: Any, default: Any = None) -> Any:
+    """Convert a score to float, replacing None/NaN with default (null in JSON output)."""
+    if _is_missing(value):
+        return default
+    return float(value)
+
+
+def _best_worst(scores: Dict[str, float]) -> Tuple[Tuple[str, float], Tuple[str, float]]:
+    """Return the (metric, score) pairs with the highest and lowest score in one pass."""
+    items = iter(scores.items())
+    best = worst = next(items)
+    for item in items:
+        if item[1] > best[1]:
+            best = item
+        elif item[1] < worst[1]:
+            worst = item
+    return best, worst
+
+
+def _to_columns(eval_data_list: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Transpose per-test records into parallel column lists (one list per field)."""
+    return {field: [eval_data.get(field) for eval_data in eval_data_list] for field in EVAL_FIELDS}
+
+
+def _latest_mtime_ns(path: str) -> int:
+    """Newest modification time of a file, or of any file under a directory (0 if missing)."""
+    root = Path(path)
+    if not root.exists():
+        return 0
+    files = [root] if root.is_file() else [p for p in root.rglob('*') if p.is_file()]
+    return max((p.stat().st_mtime_ns for p in files), default=0)
+
+
+def _system_fingerprint() -> str:
+    """
+    Identify the system under test for the agent result cache.
+    
+    Covers the models and retrieval settings the agents use, the agent code
+    itself and the built indexes, so re-indexing or changing an agent makes
+    previously cached answers miss instead of being replayed.
+    """
+    agents_dir = Path(__file__).parent.parent / "Agents"
+    parts = [
+        config.EMBEDDING_MODEL,
+        config.SUMMARY_MODEL,
+        str(config.NEEDLE_TOP_K),
+        str(config.SUMMARY_TOP_K),
+        str(config.AUTO_MERGE_THRESHOLD),
+        str(_latest_mtime_ns(str(agents_dir))),
+        str(_latest_mtime_ns(config.DOCSTORE_PATH)),
+        str(_latest_mtime_ns(config.NEEDLE_INDEX_PATH)),
+        str(_latest_mtime_ns(config.SUMMARY_INDEX_PATH))
+    ]
+    return "\x00".join(parts)
+
+
+def _score_arrays(results_df: Any) -> Dict[str, np.ndarray]:
+    """Extract each metric column once as a float64 array indexed by test position."""
+    return {metric: results_df[metric].to_numpy(dtype=np.float64) for metric in METRIC_NAMES}
+
+
+def _compute_aggregates(results_df: Any, indices: List[int] = None) -> Dict[str, float]:
+    """
+    Average every metric in one NaN-aware pass over the score matrix.
+    
+    Args:
+        results_df: RAGAS results DataFrame
+        indices: Optional row positions to restrict the averages to
+    
+    Returns:
+        Dictionary mapping metric name to its mean (NaN if no valid scores)
+    """
+    arr = results_df[METRIC_NAMES].to_numpy(dtype=np.float64)
+    if indices is not None:
+        arr = arr[indices]
+    with warnings.catch_warnings():
+        # All-NaN columns legitimately average to NaN
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        means = np.nanmean(arr, axis=0)
+    return dict(zip(METRIC_NAMES, means.tolist()))
+
+
+class _CachedEmbeddings:
+    """
+    Memoizing wrapper around a LangChain embeddings model.
+    
+    answer_relevancy, answer_similarity and answer_correctness embed many of
+    the same strings (answers, ground truths, questions); each distinct string
+    is sent to the embeddings API only once per process.
+    """
+    
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+        self._cache = {}
+        self._lock = threading.Lock()
+    
+    def _missing(self, kind: str, texts: List[str]) -> List[str]:
+        with self._lock:
+            return [t for t in dict.fromkeys(texts) if (kind, t) not in self._cache]
+    
+    def _store(self, kind: str, texts: List[str], vectors: List[List[float]]):
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                self._cache[(kind, text)] = vector
+    
+    def _lookup(self, kind: str, texts: List[str]) -> List[List[float]]:
+        with self._lock:
+            return [self._cache[(kind, t)] for t in texts]
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        missing = self._missing('doc', texts)
+        if missing:
+            self._store('doc', missing, self.embeddings.embed_documents(missing))
+        return self._lookup('doc', texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        if self._missing('query', [text]):
+            self._store('query', [text], [self.embeddings.embed_query(text)])
+        return self._lookup('query', [text])[0]
+    
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        missing = self._missing('doc', texts)
+        if missing:
+            self._store('doc', missing, await self.embeddings.aembed_documents(missing))
+        return self._lookup('doc', texts)
+    
+    async def aembed_query(self, text: str) -> List[float]:
+        if self._missing('query', [text]):
+            self._store('query', [text], [await self.embeddings.aembed_query(text)])
+        return self._lookup('query', [text])[0]
+
+
+@lru_cache(maxsize=1)
+def _get_ragas_embeddings():
+    """Build the embeddings shared by every RAGAS metric (same model RAGAS uses by default)."""
+    from langchain_openai import OpenAIEmbeddings
+    from ragas.embeddings import LangchainEmbeddingsWrapper
+    
+    return LangchainEmbeddingsWrapper(_CachedEmbeddings(OpenAIEmbeddings(
+        model=config.RAGAS_EMBEDDING_MODEL,
+        api_key=config.OPENAI_API_KEY
+    )))
+
+
+@lru_cache(maxsize=None)
+def _get_gemini_judge(model: str, api_key: str) -> "LangchainLLMWrapper":
+    """
+    Build the Gemini judge once per process.
+    
+    The client keeps one long-lived HTTP/2 (gRPC) channel, so reusing the same
+    instance lets all 6 x N judge calls share its connection instead of
+    paying a new TLS handshake whenever an evaluator is created.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from ragas.llms import LangchainLLMWrapper
+    
+    return LangchainLLMWrapper(ChatGoogleGenerativeAI(
+        model=model,
+        google_api_key=api_key,
+        temperature=0.0,
+        convert_system_message_to_human=True,
+        max_output_tokens=2048,
+        n=1  # Explicitly request 1 generation to avoid warnings
+    ))
+
+
+def _call_with_rate_limit_retry(fn, *args, out=None):
+    """
+    Call an agent method, retrying with exponential backoff when the API rate-limits us.
+    
+    Args:
+        fn: Agent method to call (e.g. needle_agent.answer_query)
+        *args: Arguments passed to fn
+        out: Stream for retry messages (stdout if None)
+    
+    Returns:
+        Return value of fn
+    """
+    delay = config.QUERY_RETRY_BACKOFF
+    for attempt in range(config.QUERY_MAX_RETRIES + 1):
+        try:
+            return fn(*args)
+        except Exception as e:
+            if getattr(e, 'status_code', None) != 429 or attempt == config.QUERY_MAX_RETRIES:
+                raise
+            print(f"  [WARNING] Rate limited (429) - retrying in {delay:.0f}s "
+                  f"({attempt + 1}/{config.QUERY_MAX_RETRIES})", file=out)
+            time.sleep(delay)
+            delay *= 2
+
+
+def _has_prefix(sorted_items: List[str], prefix: str) -> bool:
+    """Return True if any string in a sorted list starts with prefix (binary search)."""
+    idx = bisect.bisect_left(sorted_items, prefix)
+    return idx < len(sorted_items) and sorted_items[idx].startswith(prefix)
+
+
+@lru_cache(maxsize=4096)
+def _f3(value: float) -> str:
+    """Format a score with three decimals (memoized; reports repeat the same values)."""
+    return f"{value:.3f}"
+
+
+@lru_cache(maxsize=1)
+def _get_report_styles() -> Dict[str, Any]:
+    """Build the PDF report's paragraph and table styles once per process."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.units import inch
+    
+    # Report accent color, parsed once for the title, headings and system table
+    brand_blue = colors.HexColor('#1f4788')
+    
+    styles = getSampleStyleSheet()
+    normal_style = styles['Normal']
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=brand_blue,
+        spaceAfter=12,
+        spaceBefore=12
+    )
+    
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=brand_blue,
+            spaceAfter=30,
+            alignment=TA_CENTER
+        ),
+        'heading': heading_style,
+        'normal': normal_style,
+        'sub_heading': ParagraphStyle('SubHeading', parent=heading_style, fontSize=14),
+        'system_score': ParagraphStyle('SystemScore', parent=normal_style, fontSize=16, spaceAfter=6),
+        'needle_score': ParagraphStyle('NeedleScore', parent=normal_style, fontSize=14, spaceAfter=6),
+        'summary_score': ParagraphStyle('SummaryScore', parent=normal_style, fontSize=14, spaceAfter=6),
+        'italic': ParagraphStyle('Italic', parent=normal_style, fontSize=10, textColor=colors.grey),
+        'small': ParagraphStyle('Small', parent=normal_style, fontSize=9),
+        # Detailed results bake their vertical gaps into the styles instead of Spacer flowables
+        'detail': ParagraphStyle('Detail', parent=normal_style, spaceAfter=0.1*inch),
+        'detail_last': ParagraphStyle('DetailLast', parent=normal_style, spaceAfter=0.15*inch),
+        'separator': ParagraphStyle('Separator', parent=normal_style, fontSize=8, textColor=colors.lightgrey,
+                                    spaceBefore=0.2*inch),
+        'test_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+        ]),
+        'system_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), brand_blue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+        'needle_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e7d32')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#c8e6c9')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+        'summary_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1565c0')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#bbdefb')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+        'comparison_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+    }
+
+
+def _read_json(path: str) -> Any:
+    """Load a JSON file (zstd-compressed if it ends in .zst), using orjson when available."""
+    raw = Path(path).read_bytes()
+    if path.endswith('.zst'):
+        raw = zstd.ZstdDecompressor().decompress(raw)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _write_json(data: Any, path: str, compress: bool = False) -> str:
+    """
+    Write a JSON file with 2-space indentation, using orjson when available.
+    
+    Args:
+        data: JSON-serializable data
+        path: Output path
+        compress: Write zstd-compressed JSON to path + ".zst" (if zstandard is installed)
+    
+    Returns:
+        Path that was written
+    """
+    if ORJSON_AVAILABLE:
+        raw = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    if compress and ZSTD_AVAILABLE:
+        path = path + '.zst'
+        raw = zstd.ZstdCompressor(level=config.RESULTS_ZSTD_LEVEL, threads=-1).compress(raw)
+    
+    Path(path).write_bytes(raw)
+    return path
+
+
+def _json_line(data: Any) -> bytes:
+    """Serialize data as one compact JSON line, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) + b'\n'
+    return json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+class _QueryResultsWriter:
+    """
+    Writes query results as newline-delimited JSON while queries complete.
+    
+    The first line is a header with the run timestamp and query count; each
+    following line is one test case. Lines are flushed as they are written, so
+    an interrupted run keeps every query that finished.
+    """
+    
+    def __init__(self, path: str, total_queries: int):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(_json_line({
+            'timestamp': datetime.now().isoformat(),
+            'total_queries': total_queries
+        }))
+    
+    def write(self, eval_data: Dict[str, Any]):
+        self._file.write(_json_line(eval_data))
+        self._file.flush()
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_query_results(path: str, header_only: bool = False) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Load query results written by _QueryResultsWriter.
+    
+    Falls back to a query_results.json written by earlier versions (one
+    indented JSON document) when the .jsonl file does not exist yet.
+    
+    Args:
+        path: Path to the query results file
+        header_only: Read just the header line (timestamp and query count)
+    
+    Returns:
+        (header, test_cases)
+    """
+    legacy_path = os.path.splitext(path)[0] + '.json'
+    if not os.path.exists(path) and os.path.exists(legacy_path):
+        data = _read_json(legacy_path)
+        test_cases = data.pop('test_cases', [])
+        return data, ([] if header_only else test_cases)
+    
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    with open(path, 'rb') as f:
+        header = loads(f.readline())
+        if header_only:
+            return header, []
+        test_cases = [loads(line) for line in f if line.strip()]
+    return header, test_cases
+
+
+def _resolve_results_path(path: str) -> str:
+    """Return the newest of path and its compressed path + ".zst" variant that exists."""
+    candidates = [path]
+    if ZSTD_AVAILABLE:
+        candidates.append(path + '.zst')
+    existing = [p for p in candidates if os.path.exists(p)]
+    if not existing:
+        return path
+    return max(existing, key=os.path.getmtime)
+
+
+class _ThreadLocalStdout:
+    """
+    stdout proxy that diverts writes from threads with an active capture buffer.
+    
+    Installed while queries run in parallel so that the agents' own print()
+    calls land in the same per-test buffer as the evaluator's output instead
+    of hitting the terminal line by line from several threads at once.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def capture(self, buffer: io.StringIO):
+        self._local.buffer = buffer
+    
+    def release(self):
+        self._local.buffer = None
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+    
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class CachedRagasResults:
+    """Minimal stand-in for a RAGAS result built from cached and fresh scores."""
+    
+    def __init__(self, df):
+        self.df = df
+    
+    def to_pandas(self):
+        return self.df
 
 
 class RAGASEvaluator:
     """Handles RAGAS evaluation of the RAG system."""
     
-    def __init__(self):
-        """Initialize agents and Gemini judge."""
-        print("[EVALUATOR] Initializing evaluation system...")
+    def __init__(self, use_cache: bool = True, skip_routing: bool = None):
+        """
+        Initialize agents and Gemini judge.
         
-        # Initialize agents
-        self.routing_agent = RoutingAgent()
-        self.needle_agent = NeedleAgent()
-        self.summary_agent = SummaryAgent()
-        print("[EVALUATOR] - Agents initialized")
+        Args:
+            use_cache: Reuse cached agent answers and metric scores from previous runs
+            skip_routing: Send each query straight to the agent for its dataset query_type
+                          instead of calling the router (uses config default if None)
+        """
+        print("[EVALUATOR] Initializing evaluation system...")
         
-        # Initialize Gemini judge
-        self.gemini_judge = self._setup_gemini_judge()
-        print("[EVALUATOR] - Gemini judge ready")
+        self.skip_routing = config.SKIP_ROUTING if skip_routing is None else skip_routing
+        
+        # Serializes per-test output blocks when queries run in parallel
+        self._print_lock = threading.Lock()
+        
+        # Shared context strings: identical chunks retrieved by different tests
+        # become one object (see _pool_contexts)
+        self._context_pool = {}
+        
+        # Background PDF rendering (see submit_pdf_report)
+        self._pdf_pool = None
+        self._pdf_future = None
+        
+        # On-disk memoization of agent results and judge scores
+        fingerprint = _system_fingerprint()
+        self.cache = EvaluationCache(config.EVALUATION_CACHE_PATH, enabled=use_cache,
+                                     fingerprint=fingerprint,
+                                     judge=f"{config.GEMINI_MODEL}\x00{config.RAGAS_EMBEDDING_MODEL}")
+        self.semantic_cache = SemanticCache(
+            config.SEMANTIC_CACHE_INDEX_PATH,
+            config.SEMANTIC_CACHE_ENTRIES_PATH,
+            threshold=config.SEMANTIC_CACHE_THRESHOLD,
+            model_name=config.SEMANTIC_CACHE_MODEL,
+            dim=config.SEMANTIC_CACHE_DIM,
+            enabled=use_cache and config.SEMANTIC_CACHE_ENABLED,
+            fingerprint=fingerprint
+        )
+        # Fresh agent results of this run, added to the semantic index only once
+        # the run is over so questions never match each other within a run
+        self._new_results = {}
+        
+        from Agents.routing_agent import RoutingAgent
+        from Agents.needle_agent import NeedleAgent
+        from Agents.summary_agent import SummaryAgent
+        
+        # Agents and the Gemini judge are independent (clients, docstore load),
+        # so construct them concurrently rather than one after another
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            routing_future = executor.submit(RoutingAgent)
+            needle_future = executor.submit(NeedleAgent)
+            summary_future = executor.submit(SummaryAgent)
+            # Initialize Gemini judge (one client shared by every metric and evaluator)
+            judge_future = executor.submit(self._setup_gemini_judge)
+            
+            self.routing_agent = routing_future.result()
+            self.needle_agent = needle_future.result()
+            self.summary_agent = summary_future.result()
+            # Surface API errors so rate limits are retried and fallbacks are never cached
+            for agent in (self.routing_agent, self.needle_agent, self.summary_agent):
+                agent.raise_errors = True
+            print("[EVALUATOR] - Agents initialized")
+            
+            self.gemini_judge = judge_future.result()
+            print("[EVALUATOR] - Gemini judge ready")
         
         print("[EVALUATOR] All components initialized!\n")
     
-    def _setup_gemini_judge(self) -> ChatGoogleGenerativeAI:
-        """Setup Gemini as the evaluator LLM."""
+    def _setup_gemini_judge(self) -> "LangchainLLMWrapper":
+        """Setup Gemini as the evaluator LLM, wrapped for Ragas' async batching path."""
         if not config.GOOGLE_AI_API_KEY:
             raise ValueError(
                 "GOOGLE_AI_API_KEY not found in environment variables. "
                 "Please add it to your .env file for RAGAS evaluation."
             )
         
-        return ChatGoogleGenerativeAI(
-            model=config.GEMINI_MODEL,
-            google_api_key=config.GOOGLE_AI_API_KEY,
-            temperature=0.0,
-            convert_system_message_to_human=True,
-            max_output_tokens=2048,
-            n=1  # Explicitly request 1 generation to avoid warnings
-        )
+        return _get_gemini_judge(config.GEMINI_MODEL, config.GOOGLE_AI_API_KEY)
     
     def load_test_dataset(self, dataset_path: str = "Evaluation/test_dataset.json") -> List[Dict[str, Any]]:
         """Load test dataset from JSON file."""
         print(f"[EVALUATOR] Loading test dataset from: {dataset_path}")
         
         try:
-            with open(dataset_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            test_cases = data.get('test_cases', [])
-            
-            needle_count = sum(1 for tc in test_cases if tc['query_type'] == 'needle')
-            summary_count = sum(1 for tc in test_cases if tc['query_type'] == 'summary')
+            if IJSON_AVAILABLE:
+                # Stream test cases one at a time instead of materializing the whole document
+                with open(dataset_path, 'rb') as f:
+                    test_case_iter = ijson.items(f, 'test_cases.item', use_float=True)
+                    test_cases, needle_count, summary_count = self._collect_test_cases(test_case_iter)
+            else:
+                data = _read_json(dataset_path)
+                test_cases, needle_count, summary_count = self._collect_test_cases(data.get('test_cases', []))
             
             print(f"[EVALUATOR] Loaded {len(test_cases)} test cases ({needle_count} needle, {summary_count} summary)\n")
             
@@ -103,6 +654,20 @@ class RAGASEvaluator:
         except Exception as e:
             raise Exception(f"Failed to load test dataset: {e}")
     
+    @staticmethod
+    def _collect_test_cases(test_case_iter) -> Tuple[List[Dict[str, Any]], int, int]:
+        """Gather test cases and count needle/summary questions in a single pass."""
+        test_cases = []
+        needle_count = 0
+        summary_count = 0
+        for tc in test_case_iter:
+            test_cases.append(tc)
+            if tc['query_type'] == 'needle':
+                needle_count += 1
+            elif tc['query_type'] == 'summary':
+                summary_count += 1
+        return test_cases, needle_count, summary_count
+    
     def run_single_query(self, test_case: Dict[str, Any], test_num: int, total_tests: int) -> Dict[str, Any]:
         """
         Execute a single test query and capture all data for evaluation.
@@ -119,32 +684,59 @@ class RAGASEvaluator:
         question = test_case['question']
         query_type = test_case['query_type']
         
-        print("=" * 70)
-        print(f"[TEST {test_num}/{total_tests}] {test_id}")
-        print("=" * 70)
-        print(f"Question: {question}")
-        print(f"Expected Type: {query_type.upper()}")
-        print()
-        
-        # Route the query
-        routed_type = self.routing_agent.route(question)
-        print(f"[ROUTING] Query routed to: {routed_type.upper()}")
-        
-        if routed_type != query_type:
-            print(f"  [WARNING] Routing mismatch! Expected {query_type}, got {routed_type}")
-        
-        print()
-        
-        # Execute appropriate agent and capture detailed data
-        if routed_type == "needle":
-            result = self._run_needle_query(question)
-        else:  # summary
-            result = self._run_summary_query(question)
+        # Buffer this test's output so parallel runs don't interleave on stdout
+        out = self._begin_output()
+        
+        print("=" * 70, file=out)
+        print(f"[TEST {test_num}/{total_tests}] {test_id}", file=out)
+        print("=" * 70, file=out)
+        print(f"Question: {question}", file=out)
+        print(f"Expected Type: {query_type.upper()}", file=out)
+        print(file=out)
+        
+        cached = self.cache.get_query(question)
+        similar = self.semantic_cache.lookup(question) if cached is None else None
+        if self.skip_routing:
+            # Results produced by the other agent don't answer this run's question
+            if cached is not None and cached['routed_type'] != query_type:
+                cached = None
+            if similar is not None and similar[0]['routed_type'] != query_type:
+                similar = None
+        
+        if cached is not None:
+            routed_type = cached['routed_type']
+            result = cached
+            print(f"[CACHE] Reusing {routed_type.upper()} result from an earlier run", file=out)
+        elif similar is not None:
+            result, similarity, matched_question = similar
+            routed_type = result['routed_type']
+            print(f"[CACHE] Reusing {routed_type.upper()} result of similar question from an earlier run "
+                  f"(similarity {similarity:.3f}): {matched_question}", file=out)
+        else:
+            # Agents run with raise_errors, so routing/agent failures (after rate-limit
+            # retries) land here; the test is scored with an error answer, not cached
+            routed_type = query_type
+            try:
+                routed_type, result = self._route_and_answer(question, query_type, out)
+            except Exception as e:
+                print(f"  [ERROR] Query failed: {e}", file=out)
+                result = {'answer': AGENT_ERROR_ANSWER, 'contexts': [], 'chunk_ids': []}
+            else:
+                cached_result = {
+                    'routed_type': routed_type,
+                    'answer': result['answer'],
+                    'contexts': result['contexts'],
+                    'chunk_ids': result['chunk_ids']
+                }
+                self.cache.set_query(question, cached_result)
+                self._new_results[question] = cached_result
         
         # Print generated answer
-        print(f"\n[GENERATED ANSWER]")
-        print(f"{result['answer']}")
-        print()
+        print(f"\n[GENERATED ANSWER]", file=out)
+        print(f"{result['answer']}", file=out)
+        print(file=out)
+        
+        self._end_output(out)
         
         # Prepare data for RAGAS
         eval_data = {
@@ -161,19 +753,126 @@ class RAGASEvaluator:
         
         return eval_data
     
-    def _run_needle_query(self, question: str) -> Dict[str, Any]:
+    def _route_and_answer(self, question: str, query_type: str, out) -> Tuple[str, Dict[str, Any]]:
+        """
+        Route a question and run the chosen agent.
+        
+        Args:
+            question: Test question
+            query_type: Query type from the dataset (used directly when routing is skipped)
+            out: Stream for this test's output
+        
+        Returns:
+            (routed_type, result with answer, contexts and chunk_ids)
+        """
+        # Route the query (or trust the dataset's query type and save the LLM call)
+        if self.skip_routing:
+            routed_type = query_type
+            print(f"[ROUTING] Skipped - using dataset query type: {routed_type.upper()}", file=out)
+        else:
+            routed_type = _call_with_rate_limit_retry(self.routing_agent.route, question, out=out)
+            print(f"[ROUTING] Query routed to: {routed_type.upper()}", file=out)
+        
+        if routed_type != query_type:
+            print(f"  [WARNING] Routing mismatch! Expected {query_type}, got {routed_type}", file=out)
+        
+        print(file=out)
+        
+        # Execute appropriate agent and capture detailed data
+        if routed_type == "needle":
+            result = self._run_needle_query(question, out)
+        else:  # summary
+            result = self._run_summary_query(question, out)
+        return routed_type, result
+    
+    def run_all_queries_parallel(self, test_cases: List[Dict[str, Any]], max_workers: int = None,
+                                 max_concurrency: int = None, on_result=None) -> List[Dict[str, Any]]:
+        """
+        Execute all test queries concurrently on a thread pool.
+        
+        Queries are I/O-bound (routing, retrieval and generation round-trips), so
+        threads overlap the network waits. Results keep the dataset order.
+        
+        Args:
+            test_cases: Test case dictionaries from the dataset
+            max_workers: Thread pool size (uses config default if None)
+            max_concurrency: Maximum in-flight queries (uses config default if None)
+            on_result: Called with each test's evaluation data, in dataset order, as soon as it
+                and every earlier test have finished (e.g. to stream results to disk)
+        
+        Returns:
+            List of evaluation data dictionaries, one per test case
+        """
+        if max_workers is None:
+            max_workers = config.EVALUATION_MAX_WORKERS
+        if max_concurrency is None:
+            max_concurrency = config.EVALUATION_MAX_CONCURRENT_QUERIES
+        
+        total_tests = len(test_cases)
+        semaphore = threading.Semaphore(max_concurrency)
+        
+        def run(indexed_case):
+            test_num, test_case = indexed_case
+            with semaphore:
+                return self.run_single_query(test_case, test_num, total_tests)
+        
+        # Route the agents' prints into each test's buffer while workers run
+        real_stdout = sys.stdout
+        sys.stdout = _ThreadLocalStdout(real_stdout)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                eval_data_list = []
+                for eval_data in executor.map(run, enumerate(test_cases, 1)):
+                    if on_result is not None:
+                        on_result(eval_data)
+                    eval_data_list.append(eval_data)
+        finally:
+            sys.stdout = real_stdout
+        
+        for question, cached_result in self._new_results.items():
+            self.semantic_cache.add(question, cached_result)
+        self._new_results = {}
+        
+        self.cache.save()
+        self.semantic_cache.save()
+        return eval_data_list
+    
+    def _begin_output(self) -> io.StringIO:
+        """Start buffering one test's output (including agent prints when running in parallel)."""
+        out = io.StringIO()
+        if isinstance(sys.stdout, _ThreadLocalStdout):
+            sys.stdout.capture(out)
+        return out
+    
+    def _end_output(self, out: io.StringIO):
+        """Stop buffering and emit the test's output as a single write."""
+        stream = sys.stdout
+        if isinstance(stream, _ThreadLocalStdout):
+            stream.release()
+            stream = stream.stream
+        
+        with self._print_lock:
+            stream.write(out.getvalue())
+            stream.flush()
+    
+    def _pool_contexts(self, contexts: List[str]) -> List[str]:
+        """Replace each context with the pooled copy of the same text so duplicates share one string."""
+        pool = self._context_pool
+        return [pool.setdefault(context, context) for context in contexts]
+    
+    def _run_needle_query(self, question: str, out=None) -> Dict[str, Any]:
         """Run needle query and capture detailed context."""
         # Get the answer
-        result = self.needle_agent.answer_query(question)
+        result = _call_with_rate_limit_retry(self.needle_agent.answer_query, question, out=out)
         
         # Print retrieved chunks for visibility
-        print(f"\n[NEEDLE AGENT] Retrieved {len(result['sources'])} chunks:")
+        print(f"\n[NEEDLE AGENT] Retrieved {len(result['sources'])} chunks:", file=out)
         for i, source in enumerate(result['sources'], 1):
             chunk_id = source.get('chunk_id', 'unknown')
             page = source.get('page', '?')
             # Extract chunk index from chunk_id (format: page_X_chunk_Y)
             chunk_index = chunk_id.split('_')[-1] if '_' in chunk_id else '?'
-            print(f"  {i}. {chunk_id} (Page {page}, Chunk {chunk_index})")
+            print(f"  {i}. {chunk_id} (Page {page}, Chunk {chunk_index})", file=out)
         
         # Extract contexts (chunk contents)
         contexts = []
@@ -185,24 +884,26 @@ class RAGASEvaluator:
             chunk_ids.append(chunk_id)
             contexts.append(content)
         
+        contexts = self._pool_contexts(contexts)
+        
         return {
             'answer': result['answer'],
             'contexts': contexts,
             'chunk_ids': chunk_ids
         }
     
-    def _run_summary_query(self, question: str) -> Dict[str, Any]:
+    def _run_summary_query(self, question: str, out=None) -> Dict[str, Any]:
         """Run summary query and capture detailed context."""
         # Get the answer
-        result = self.summary_agent.answer_query(question)
+        result = _call_with_rate_limit_retry(self.summary_agent.answer_query, question, out=out)
         
         # Print retrieved summaries for visibility
-        print(f"\n[SUMMARY AGENT] Retrieved {len(result['sources'])} page summaries:")
+        print(f"\n[SUMMARY AGENT] Retrieved {len(result['sources'])} page summaries:", file=out)
         for i, source in enumerate(result['sources'], 1):
             page = source.get('page', '?')
             header = source.get('header', 'Unknown')
             page_type = source.get('type', 'Unknown')
-            print(f"  {i}. Page {page}: {header} ({page_type})")
+            print(f"  {i}. Page {page}: {header} ({page_type})", file=out)
         
         # Extract contexts (summary contents)
         contexts = []
@@ -215,6 +916,8 @@ class RAGASEvaluator:
             chunk_ids.append(chunk_id)
             contexts.append(content)
         
+        contexts = self._pool_contexts(contexts)
+        
         return {
             'answer': result['answer'],
             'contexts': contexts,
@@ -235,22 +938,18 @@ class RAGASEvaluator:
         print("RUNNING RAGAS METRICS WITH GEMINI JUDGE")
         print("=" * 70)
         
-        # Prepare dataset for RAGAS
-        ragas_data = {
-            'question': [],
-            'answer': [],
-            'contexts': [],
-            'ground_truth': []
-        }
-        
-        for eval_data in eval_data_list:
-            ragas_data['question'].append(eval_data['question'])
-            ragas_data['answer'].append(eval_data['answer'])
-            ragas_data['contexts'].append(eval_data['contexts'])
-            ragas_data['ground_truth'].append(eval_data['ground_truth'])
-        
-        # Create RAGAS dataset
-        dataset = Dataset.from_dict(ragas_data)
+        # RAGAS imports
+        from datasets import Dataset
+        from ragas import evaluate
+        from ragas.run_config import RunConfig
+        from ragas.metrics import (
+            context_precision,
+            context_recall,
+            faithfulness,
+            answer_relevancy,
+            answer_similarity,
+            answer_correctness
+        )
         
         # Define metrics with Gemini as judge
         metrics = [
@@ -261,6 +960,45 @@ class RAGASEvaluator:
             answer_similarity,
             answer_correctness
         ]
+        metric_names = [metric.name for metric in metrics]
+        
+        columns = _to_columns(eval_data_list)
+        # Results loaded from disk or the cache carry separate copies of repeated chunks
+        columns['contexts'] = [self._pool_contexts(contexts) for contexts in columns['contexts']]
+        
+        # Look up cached scores; a test case is only skipped if every metric is cached
+        score_keys = []
+        cached_scores = {}
+        pending = []
+        for i, (question, answer, contexts, ground_truth) in enumerate(
+                zip(*(columns[field] for field in RAGAS_FIELDS))):
+            keys = {
+                name: self.cache.score_key(question, answer, contexts, ground_truth, name)
+                for name in metric_names
+            }
+            score_keys.append(keys)
+            scores = {name: self.cache.get_score(key) for name, key in keys.items()}
+            if all(score is not None for score in scores.values()):
+                cached_scores[i] = scores
+            else:
+                pending.append(i)
+        
+        if cached_scores:
+            print(f"\n[CACHE] {len(cached_scores)}/{len(eval_data_list)} test cases already scored")
+        
+        if not pending:
+            print("[OK] All scores loaded from cache!")
+            self.cache.print_stats()
+            return CachedRagasResults(self._merge_cached_scores(eval_data_list, cached_scores, None, []))
+        
+        # Prepare dataset for RAGAS (columns pass through as-is unless some rows are cached)
+        if cached_scores:
+            ragas_data = {field: [columns[field][i] for i in pending] for field in RAGAS_FIELDS}
+        else:
+            ragas_data = {field: columns[field] for field in RAGAS_FIELDS}
+        
+        # Create RAGAS dataset
+        dataset = Dataset.from_dict(ragas_data)
         
         print("\n[GEMINI JUDGE] Evaluating all test cases across 6 metrics...")
         print("  - Context Precision")
@@ -269,20 +1007,41 @@ class RAGASEvaluator:
         print("  - Answer Relevancy")
         print("  - Answer Similarity")
         print("  - Answer Correctness")
+        print(f"\n[GEMINI JUDGE] Dispatching up to {config.RAGAS_MAX_WORKERS} judge calls concurrently")
         print("\nThis may take a few minutes...\n")
         
+        # Judge calls are independent, so let Ragas run them concurrently
+        run_config = RunConfig(
+            max_workers=config.RAGAS_MAX_WORKERS,
+            timeout=config.RAGAS_TIMEOUT,
+            max_retries=config.RAGAS_MAX_RETRIES
+        )
+        
         # Run evaluation
         try:
             results = evaluate(
                 dataset,
                 metrics=metrics,
                 llm=self.gemini_judge,
-                embeddings=None,  # Will use default
-                raise_exceptions=False  # Don't fail on warnings
+                embeddings=_get_ragas_embeddings(),
+                raise_exceptions=False,  # Don't fail on warnings
+                run_config=run_config
             )
             
             print("[OK] RAGAS evaluation completed!")
-            return results
+            
+            # Remember fresh scores for the next run
+            results_df = results.to_pandas()
+            scored_names = [name for name in metric_names if name in results_df.columns]
+            for i, row_scores in zip(pending, results_df[scored_names].itertuples(index=False, name=None)):
+                for name, score in zip(scored_names, row_scores):
+                    self.cache.set_score(score_keys[i][name], score)
+            self.cache.save()
+            self.cache.print_stats()
+            
+            if not cached_scores:
+                return results
+            return CachedRagasResults(self._merge_cached_scores(eval_data_list, cached_scores, results_df, pending))
         
         except Exception as e:
             print(f"[ERROR] RAGAS evaluation failed: {e}")
@@ -290,30 +1049,56 @@ class RAGASEvaluator:
             traceback.print_exc()
             return None
     
-    def print_detailed_results(self, eval_data_list: List[Dict[str, Any]], ragas_results: Any):
+    def _merge_cached_scores(self, eval_data_list: List[Dict[str, Any]], cached_scores: Dict[int, Dict[str, float]],
+                             results_df: Any, pending: List[int]) -> Any:
+        """
+        Combine cached scores with freshly judged rows into one DataFrame in dataset order.
+        
+        Args:
+            eval_data_list: List of evaluation data dictionaries
+            cached_scores: Metric scores keyed by test case index
+            results_df: RAGAS results DataFrame for the pending test cases (or None)
+            pending: Test case indices that were judged in this run
+        
+        Returns:
+            pandas DataFrame with one row per test case
+        """
+        import pandas as pd
+        
+        fresh_rows = {}
+        if results_df is not None:
+            fresh_rows = dict(zip(pending, results_df.to_dict('records')))
+        
+        rows = []
+        for i, eval_data in enumerate(eval_data_list):
+            if i in fresh_rows:
+                rows.append(fresh_rows[i])
+            else:
+                rows.append({
+                    'question': eval_data['question'],
+                    'answer': eval_data['answer'],
+                    'contexts': eval_data['contexts'],
+                    'ground_truth': eval_data['ground_truth'],
+                    **cached_scores[i]
+                })
+        
+        return pd.DataFrame(rows)
+    
+    def print_detailed_results(self, eval_data_list: List[Dict[str, Any]], results_df: Any):
         """Print detailed results with scoring."""
         print("\n" + "=" * 70)
         print("DETAILED RESULTS BY TEST CASE")
         print("=" * 70)
         
-        # Convert results to dict for easier access
-        results_df = ragas_results.to_pandas()
+        # Convert results to per-metric arrays for easier access
+        score_arrays = _score_arrays(results_df)
         
         for idx, eval_data in enumerate(eval_data_list):
             print(f"\n[{eval_data['test_id']}] {eval_data['question']}")
             print("-" * 70)
             
             # Get scores for this test case
-            row = results_df.iloc[idx]
-            
-            scores = {
-                'Context Precision': row.get('context_precision', 0),
-                'Context Recall': row.get('context_recall', 0),
-                'Faithfulness': row.get('faithfulness', 0),
-                'Answer Relevancy': row.get('answer_relevancy', 0),
-                'Answer Similarity': row.get('answer_similarity', 0),
-                'Answer Correctness': row.get('answer_correctness', 0)
-            }
+            scores = {label: score_arrays[metric][idx] for metric, label in METRIC_LABELS.items()}
             
             # Print scores with warnings for low scores
             for metric, score in scores.items():
@@ -324,17 +1109,14 @@ class RAGASEvaluator:
             expected = set(eval_data.get('expected_chunks', []))
             retrieved = set(eval_data.get('retrieved_chunk_ids', []))
             
-            # Handle wildcards in expected chunks
-            actual_expected = set()
-            for exp in expected:
-                if exp.endswith('_*'):
-                    # Match any chunk from that page
-                    prefix = exp[:-1]
-                    actual_expected.update([r for r in retrieved if r.startswith(prefix)])
-                else:
-                    actual_expected.add(exp)
+            # Handle wildcards in expected chunks: "page_3_*" matches any chunk from that page
+            retrieved_sorted = sorted(retrieved)
+            wildcard_hit = any(
+                _has_prefix(retrieved_sorted, exp[:-1]) for exp in expected if exp.endswith('_*')
+            )
+            literal_expected = {exp for exp in expected if not exp.endswith('_*')}
             
-            if actual_expected and not actual_expected.intersection(retrieved):
+            if not wildcard_hit and literal_expected and literal_expected.isdisjoint(retrieved):
                 print(f"  [INFO] Expected chunks: {', '.join(expected)}")
                 print(f"  [INFO] Retrieved chunks: {', '.join(retrieved)}")
                 print(f"  [WARNING] None of the expected chunks were retrieved!")
@@ -344,13 +1126,14 @@ class RAGASEvaluator:
         print("AGGREGATE SCORES")
         print("=" * 70)
         
+        agg = _compute_aggregates(results_df)
         avg_scores = {
-            'Context Precision': results_df['context_precision'].mean(),
-            'Context Recall': results_df['context_recall'].mean(),
-            'Faithfulness': results_df['faithfulness'].mean(),
-            'Answer Relevancy': results_df['answer_relevancy'].mean(),
-            'Answer Similarity': results_df['answer_similarity'].mean(),
-            'Answer Correctness': results_df['answer_correctness'].mean()
+            'Context Precision': agg['context_precision'],
+            'Context Recall': agg['context_recall'],
+            'Faithfulness': agg['faithfulness'],
+            'Answer Relevancy': agg['answer_relevancy'],
+            'Answer Similarity': agg['answer_similarity'],
+            'Answer Correctness': agg['answer_correctness']
         }
         
         for metric, score in avg_scores.items():
@@ -361,29 +1144,34 @@ class RAGASEvaluator:
         overall = sum(avg_scores.values()) / len(avg_scores)
         print(f"\n  Overall Score: {overall:.3f}")
     
-    def save_results(self, eval_data_list: List[Dict[str, Any]], ragas_results: Any, output_path: str = None):
-        """Save evaluation results to JSON file."""
+    def save_results(self, eval_data_list: List[Dict[str, Any]], results_df: Any, output_path: str = None,
+                     compress: bool = True):
+        """
+        Save evaluation results to JSON file.
+        
+        Args:
+            eval_data_list: List of evaluation data dictionaries
+            results_df: RAGAS results DataFrame (one row per test case)
+            output_path: Path to save JSON (uses config default if None)
+            compress: Write zstd-compressed JSON (output_path + ".zst") when zstandard is installed
+        """
         if output_path is None:
             output_path = config.EVALUATION_RESULTS_PATH
         
-        # Convert results to dict
-        results_df = ragas_results.to_pandas()
-        
         # Load query_results to get its timestamp for reference
         query_results_timestamp = None
         try:
-            with open(config.QUERY_RESULTS_PATH, 'r', encoding='utf-8') as f:
-                query_data = json.load(f)
-                query_results_timestamp = query_data.get('timestamp', 'unknown')
+            query_header, _ = _read_query_results(config.QUERY_RESULTS_PATH, header_only=True)
+            query_results_timestamp = query_header.get('timestamp', 'unknown')
         except Exception as e:
             print(f"[WARNING] Could not load query_results timestamp: {e}")
         
-        # Helper function to safely convert values, replacing NaN with None
-        import math
-        def safe_float(value, default=None):
-            if value is None or (isinstance(value, float) and math.isnan(value)):
-                return default
-            return float(value)
+        agg = _compute_aggregates(results_df)
+        
+        # Per-test scores as one matrix; NaN cells are written as null
+        score_matrix = results_df[METRIC_NAMES].to_numpy(dtype=np.float64)
+        nan_mask = np.isnan(score_matrix).tolist()
+        score_rows = score_matrix.tolist()
         
         output_data = {
             'evaluation_timestamp': datetime.now().isoformat(),
@@ -391,26 +1179,12 @@ class RAGASEvaluator:
             'query_results_file': config.QUERY_RESULTS_PATH,
             'total_tests': len(eval_data_list),
             'test_results': [],
-            'aggregate_scores': {
-                'context_precision': safe_float(results_df['context_precision'].mean()),
-                'context_recall': safe_float(results_df['context_recall'].mean()),
-                'faithfulness': safe_float(results_df['faithfulness'].mean()),
-                'answer_relevancy': safe_float(results_df['answer_relevancy'].mean()),
-                'answer_similarity': safe_float(results_df['answer_similarity'].mean()),
-                'answer_correctness': safe_float(results_df['answer_correctness'].mean())
-            }
+            'aggregate_scores': {metric: _safe_float(score) for metric, score in agg.items()}
         }
         
         # Add individual test results
         for idx, eval_data in enumerate(eval_data_list):
-            row = results_df.iloc[idx]
-            
-            # Helper function already defined above
-            def safe_float_local(value, default=None):
-                if value is None or (isinstance(value, float) and math.isnan(value)):
-                    return default
-                return float(value)
-            
+            row, row_nan = score_rows[idx], nan_mask[idx]
             test_result = {
                 'test_id': eval_data['test_id'],
                 'question': eval_data['question'],
@@ -421,42 +1195,27 @@ class RAGASEvaluator:
                 'expected_chunks': eval_data['expected_chunks'],
                 'retrieved_chunk_ids': eval_data['retrieved_chunk_ids'],
                 'scores': {
-                    'context_precision': safe_float_local(row.get('context_precision')),
-                    'context_recall': safe_float_local(row.get('context_recall')),
-                    'faithfulness': safe_float_local(row.get('faithfulness')),
-                    'answer_relevancy': safe_float_local(row.get('answer_relevancy')),
-                    'answer_similarity': safe_float_local(row.get('answer_similarity')),
-                    'answer_correctness': safe_float_local(row.get('answer_correctness'))
+                    metric: None if row_nan[j] else row[j] for j, metric in enumerate(METRIC_NAMES)
                 }
             }
             output_data['test_results'].append(test_result)
         
         # Save to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        output_path = _write_json(output_data, output_path, compress=compress)
         
         print(f"[OK] Results saved to: {output_path}")
         print(f"[INFO] Linked to query results: {query_results_timestamp}")
     
-    def generate_pdf_report(self, eval_data_list: List[Dict[str, Any]], ragas_results: Any, output_path: str = None, evaluation_timestamp: str = None):
-        """
-        Generate a comprehensive PDF report of evaluation results.
-        
-        Args:
-            eval_data_list: List of evaluation data dictionaries
-            ragas_results: RAGAS results object with metrics
-            output_path: Path to save PDF (uses config default if None)
-            evaluation_timestamp: ISO timestamp of when evaluation was run (if None, loads from results file)
-        """
+    def _resolve_pdf_report_args(self, output_path: str = None, evaluation_timestamp: str = None):
+        """Fill in the default report path and the human-readable evaluation date."""
         if output_path is None:
             output_path = config.EVALUATION_REPORT_PATH
         
         # Get evaluation timestamp from results file if not provided
         if evaluation_timestamp is None:
             try:
-                with open(config.EVALUATION_RESULTS_PATH, 'r', encoding='utf-8') as f:
-                    results_data = json.load(f)
-                    evaluation_timestamp = results_data.get('evaluation_timestamp')
+                results_data = _read_json(_resolve_results_path(config.EVALUATION_RESULTS_PATH))
+                evaluation_timestamp = results_data.get('evaluation_timestamp')
             except Exception as e:
                 print(f"[WARNING] Could not load evaluation timestamp: {e}")
                 evaluation_timestamp = datetime.now().isoformat()
@@ -468,389 +1227,370 @@ class RAGASEvaluator:
         except Exception:
             formatted_date = evaluation_timestamp  # Use as-is if parsing fails
         
+        return output_path, formatted_date
+    
+    def generate_pdf_report(self, eval_data_list: List[Dict[str, Any]], results_df: Any, output_path: str = None, evaluation_timestamp: str = None):
+        """
+        Generate a comprehensive PDF report of evaluation results.
+        
+        Args:
+            eval_data_list: List of evaluation data dictionaries
+            results_df: RAGAS results DataFrame (one row per test case)
+            output_path: Path to save PDF (uses config default if None)
+            evaluation_timestamp: ISO timestamp of when evaluation was run (if None, loads from results file)
+        """
+        if not eval_data_list:
+            print("\n[WARNING] No test results - skipping PDF report")
+            return None
+        
+        output_path, formatted_date = self._resolve_pdf_report_args(output_path, evaluation_timestamp)
+        
         print(f"\n[PDF REPORT] Generating PDF report...")
+        _render_pdf_report(eval_data_list, results_df, output_path, formatted_date)
         
-        # Create PDF
-        doc = SimpleDocTemplate(output_path, pagesize=letter,
-                              rightMargin=0.5*inch, leftMargin=0.5*inch,
-                              topMargin=0.5*inch, bottomMargin=0.5*inch)
+        print(f"[OK] PDF report saved to: {output_path}")
+        return output_path
+    
+    def submit_pdf_report(self, eval_data_list: List[Dict[str, Any]], results_df: Any, output_path: str = None,
+                          evaluation_timestamp: str = None) -> Future:
+        """
+        Render the PDF report in a background process.
         
-        # Container for PDF elements
-        story = []
+        ReportLab layout is pure CPU work, so it runs in a separate process while
+        the caller keeps printing results. Call wait_for_pdf_report() before exiting.
         
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1f4788'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#1f4788'),
-            spaceAfter=12,
-            spaceBefore=12
+        Args:
+            eval_data_list: List of evaluation data dictionaries
+            results_df: RAGAS results DataFrame (one row per test case)
+            output_path: Path to save PDF (uses config default if None)
+            evaluation_timestamp: ISO timestamp of when evaluation was run (if None, loads from results file)
+        
+        Returns:
+            Future resolving to the PDF path, or None if there are no test results
+        """
+        if not eval_data_list:
+            print("\n[WARNING] No test results - skipping PDF report")
+            return None
+        
+        output_path, formatted_date = self._resolve_pdf_report_args(output_path, evaluation_timestamp)
+        
+        print(f"\n[PDF REPORT] Rendering PDF report in the background...")
+        if self._pdf_pool is None:
+            self._pdf_pool = ProcessPoolExecutor(max_workers=1)
+        self._pdf_future = self._pdf_pool.submit(
+            _render_pdf_report, eval_data_list, results_df, output_path, formatted_date
         )
-        normal_style = styles['Normal']
-        
-        # Convert results to DataFrame
-        results_df = ragas_results.to_pandas()
-        
-        # Separate results by query type
-        needle_indices = [i for i, e in enumerate(eval_data_list) if e['query_type'] == 'needle']
-        summary_indices = [i for i, e in enumerate(eval_data_list) if e['query_type'] == 'summary']
-        
-        needle_results = results_df.iloc[needle_indices] if needle_indices else None
-        summary_results = results_df.iloc[summary_indices] if summary_indices else None
-        
-        # Calculate aggregate scores for each agent
-        metric_names = ['context_precision', 'context_recall', 'faithfulness', 
-                       'answer_relevancy', 'answer_similarity', 'answer_correctness']
-        
-        import math
-        import numpy as np
-        
-        needle_scores = {}
-        summary_scores = {}
-        overall_scores = {}
-        
-        for metric in metric_names:
-            if needle_results is not None and len(needle_results) > 0:
-                needle_scores[metric] = needle_results[metric].mean()
-            if summary_results is not None and len(summary_results) > 0:
-                summary_scores[metric] = summary_results[metric].mean()
-            overall_scores[metric] = results_df[metric].mean()
-        
-        # Calculate overall averages, excluding NaN values
-        def calc_avg_excluding_nan(scores_dict):
-            valid_scores = [v for v in scores_dict.values() if not (isinstance(v, float) and math.isnan(v))]
-            return sum(valid_scores) / len(valid_scores) if valid_scores else 0
-        
-        needle_avg = calc_avg_excluding_nan(needle_scores) if needle_scores else 0
-        summary_avg = calc_avg_excluding_nan(summary_scores) if summary_scores else 0
-        system_avg = calc_avg_excluding_nan(overall_scores)
-        
-        # OVERVIEW PAGE 1
-        story.append(Paragraph("RAGAS Evaluation Report", title_style))
-        story.append(Spacer(1, 0.2*inch))
-        
-        # Metadata
-        metadata_text = f"""
-        <b>Evaluation Date:</b> {formatted_date}<br/>
-        <b>Total Test Cases:</b> {len(eval_data_list)}<br/>
-        <b>Needle Questions:</b> {len(needle_indices)}<br/>
-        <b>Summary Questions:</b> {len(summary_indices)}<br/>
-        <b>Judge Model:</b> {config.GEMINI_MODEL}
+        return self._pdf_future
+    
+    def wait_for_pdf_report(self, timeout: float = None) -> str:
         """
-        story.append(Paragraph(metadata_text, normal_style))
-        story.append(Spacer(1, 0.3*inch))
+        Wait for a report started with submit_pdf_report() and shut down the worker.
         
-        # OVERALL SYSTEM PERFORMANCE
-        story.append(Paragraph("Overall System Performance", heading_style))
-        system_color = colors.green if system_avg >= 0.8 else colors.orange if system_avg >= 0.6 else colors.red
-        system_text = f'<font color="{system_color.hexval()}"><b>System Score: {system_avg:.3f}</b></font>'
-        story.append(Paragraph(system_text, ParagraphStyle('SystemScore', parent=normal_style, fontSize=16, spaceAfter=6)))
-        
-        # System status
-        if system_avg >= 0.8:
-            status_text = "✓ Excellent - System performing at high quality"
-        elif system_avg >= 0.7:
-            status_text = "○ Good - System performing well with room for improvement"
-        elif system_avg >= 0.6:
-            status_text = "⚠ Acceptable - System needs optimization"
-        else:
-            status_text = "✗ Poor - System requires significant improvements"
-        story.append(Paragraph(status_text, normal_style))
-        story.append(Spacer(1, 0.3*inch))
+        Args:
+            timeout: Seconds to wait (waits indefinitely if None)
         
-        # System-wide metrics table
-        story.append(Paragraph("System-Wide Metrics", ParagraphStyle('SubHeading', parent=heading_style, fontSize=14)))
-        system_data = [['Metric', 'Score', 'Status']]
-        metric_labels = {
-            'context_precision': 'Context Precision',
-            'context_recall': 'Context Recall',
-            'faithfulness': 'Faithfulness',
-            'answer_relevancy': 'Answer Relevancy',
-            'answer_similarity': 'Answer Similarity',
-            'answer_correctness': 'Answer Correctness'
-        }
+        Returns:
+            Path of the generated PDF, or None if no report was submitted
+        """
+        if self._pdf_future is None:
+            return None
         
-        # Helper function to format scores, showing "N/A" for NaN
-        def format_score(score):
-            if score is None or (isinstance(score, float) and math.isnan(score)):
-                return "N/A"
-            return f'{score:.3f}'
-        
-        for metric, score in overall_scores.items():
-            label = metric_labels[metric]
-            if score is None or (isinstance(score, float) and math.isnan(score)):
-                status = '⚠ N/A'
-                score_text = "N/A"
-            else:
-                status = '✓ Excellent' if score >= 0.8 else '○ Good' if score >= 0.7 else '⚠ Needs Work'
-                score_text = f'{score:.3f}'
-            system_data.append([label, score_text, status])
+        try:
+            output_path = self._pdf_future.result(timeout=timeout)
+            print(f"[OK] PDF report saved to: {output_path}")
+            return output_path
+        finally:
+            self._pdf_future = None
+            self._pdf_pool.shutdown()
+            self._pdf_pool = None
+
+
+def _render_pdf_report(eval_data_list: List[Dict[str, Any]], results_df: Any, output_path: str,
+                       formatted_date: str) -> str:
+    """
+    Lay out and write the PDF report.
+    
+    Module-level (and free of evaluator state) so it can run in a worker process.
+    
+    Args:
+        eval_data_list: List of evaluation data dictionaries
+        results_df: RAGAS results DataFrame (one row per test case)
+        output_path: Path to save PDF
+        formatted_date: Human-readable evaluation date for the header
+    
+    Returns:
+        Path of the generated PDF
+    """
+    # PDF generation
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, LongTable, PageBreak
+    from reportlab.lib import colors
+    
+    # Create PDF
+    doc = SimpleDocTemplate(output_path, pagesize=letter,
+                          rightMargin=0.5*inch, leftMargin=0.5*inch,
+                          topMargin=0.5*inch, bottomMargin=0.5*inch)
+    
+    # Container for PDF elements
+    story = []
+    
+    # Styles (built once and shared across reports)
+    report_styles = _get_report_styles()
+    title_style = report_styles['title']
+    heading_style = report_styles['heading']
+    normal_style = report_styles['normal']
+    small_style = report_styles['small']
+    detail_style = report_styles['detail']
+    
+    # Separate results by query type
+    needle_indices = [i for i, e in enumerate(eval_data_list) if e['query_type'] == 'needle']
+    summary_indices = [i for i, e in enumerate(eval_data_list) if e['query_type'] == 'summary']
+    
+    # Calculate aggregate scores for each agent
+    needle_scores = _compute_aggregates(results_df, needle_indices) if needle_indices else {}
+    summary_scores = _compute_aggregates(results_df, summary_indices) if summary_indices else {}
+    overall_scores = _compute_aggregates(results_df)
+    
+    # Calculate overall averages, excluding NaN values
+    def calc_avg_excluding_nan(scores_dict):
+        valid_scores = [v for v in scores_dict.values() if not _is_missing(v)]
+        return sum(valid_scores) / len(valid_scores) if valid_scores else 0
+    
+    needle_avg = calc_avg_excluding_nan(needle_scores) if needle_scores else 0
+    summary_avg = calc_avg_excluding_nan(summary_scores) if summary_scores else 0
+    system_avg = calc_avg_excluding_nan(overall_scores)
+    
+    # OVERVIEW PAGE 1
+    story.append(Paragraph("RAGAS Evaluation Report", title_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    # Metadata
+    metadata_text = f"""
+    <b>Evaluation Date:</b> {formatted_date}<br/>
+    <b>Total Test Cases:</b> {len(eval_data_list)}<br/>
+    <b>Needle Questions:</b> {len(needle_indices)}<br/>
+    <b>Summary Questions:</b> {len(summary_indices)}<br/>
+    <b>Judge Model:</b> {config.GEMINI_MODEL}
+    """
+    story.append(Paragraph(metadata_text, normal_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+    # OVERALL SYSTEM PERFORMANCE
+    story.append(Paragraph("Overall System Performance", heading_style))
+    system_color = colors.green if system_avg >= 0.8 else colors.orange if system_avg >= 0.6 else colors.red
+    system_text = f'<font color="{system_color.hexval()}"><b>System Score: {_f3(system_avg)}</b></font>'
+    story.append(Paragraph(system_text, report_styles['system_score']))
+    
+    # System status
+    if system_avg >= 0.8:
+        status_text = "✓ Excellent - System performing at high quality"
+    elif system_avg >= 0.7:
+        status_text = "○ Good - System performing well with room for improvement"
+    elif system_avg >= 0.6:
+        status_text = "⚠ Acceptable - System needs optimization"
+    else:
+        status_text = "✗ Poor - System requires significant improvements"
+    story.append(Paragraph(status_text, normal_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+    # System-wide metrics table
+    story.append(Paragraph("System-Wide Metrics", report_styles['sub_heading']))
+    system_data = [['Metric', 'Score', 'Status']]
+    metric_labels = METRIC_LABELS
+    
+    # Helper function to format scores, showing "N/A" for NaN
+    def format_score(score):
+        if _is_missing(score):
+            return "N/A"
+        return _f3(score)
+    
+    for metric, score in overall_scores.items():
+        label = metric_labels[metric]
+        if _is_missing(score):
+            status = '⚠ N/A'
+            score_text = "N/A"
+        else:
+            status = '✓ Excellent' if score >= 0.8 else '○ Good' if score >= 0.7 else '⚠ Needs Work'
+            score_text = _f3(score)
+        system_data.append([label, score_text, status])
+    
+    system_table = LongTable(system_data, colWidths=[3*inch, 1*inch, 2*inch], style=report_styles['system_table'])
+    story.append(system_table)
+    story.append(Spacer(1, 0.3*inch))
+    
+    # Page break to agent-specific performance
+    story.append(PageBreak())
+    
+    # Row of an agent metrics table: label, score and difference from the system average
+    def agent_metric_row(metric, score):
+        label = metric_labels[metric]
+        system_score = overall_scores[metric]
+        
+        # Handle NaN in scores
+        if _is_missing(score):
+            return [label, "N/A", "N/A"]
+        
+        if _is_missing(system_score):
+            return [label, _f3(score), "N/A"]
+        
+        diff = score - system_score
+        if diff > 0.01:
+            diff_text = Paragraph(f'<font color="green">+{_f3(diff)}</font>', normal_style)
+        elif diff < -0.05:
+            diff_text = Paragraph(f'<font color="red">{_f3(diff)}</font>', normal_style)
+        else:
+            diff_text = _f3(diff)
+        return [label, _f3(score), diff_text]
+    
+    # OVERVIEW PAGE 2: AGENT-SPECIFIC PERFORMANCE
+    story.append(Paragraph("Agent-Specific Performance", title_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    # NEEDLE AGENT PERFORMANCE
+    if needle_scores:
+        story.append(Paragraph("Needle Agent Performance", heading_style))
+        story.append(Paragraph(f"<i>Handles specific detail queries (needle-in-a-haystack)</i>", 
+                              report_styles['italic']))
+        story.append(Spacer(1, 0.1*inch))
+        
+        needle_color = colors.green if needle_avg >= 0.8 else colors.orange if needle_avg >= 0.6 else colors.red
+        needle_text = f'<font color="{needle_color.hexval()}"><b>Needle Agent Score: {_f3(needle_avg)}</b></font> ({len(needle_indices)} tests)'
+        story.append(Paragraph(needle_text, report_styles['needle_score']))
+        story.append(Spacer(1, 0.1*inch))
+        
+        # Needle metrics table
+        needle_data = [['Metric', 'Score', 'vs System Avg']] + [
+            agent_metric_row(metric, score) for metric, score in needle_scores.items()
+        ]
         
-        system_table = Table(system_data, colWidths=[3*inch, 1*inch, 2*inch])
-        system_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4788')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        story.append(system_table)
+        needle_table = LongTable(needle_data, colWidths=[3*inch, 1*inch, 1.5*inch], style=report_styles['needle_table'])
+        story.append(needle_table)
         story.append(Spacer(1, 0.3*inch))
+    
+    # SUMMARY AGENT PERFORMANCE
+    if summary_scores:
+        story.append(Paragraph("Summary Agent Performance", heading_style))
+        story.append(Paragraph(f"<i>Handles high-level overview queries</i>", 
+                              report_styles['italic']))
+        story.append(Spacer(1, 0.1*inch))
+        
+        summary_color = colors.green if summary_avg >= 0.8 else colors.orange if summary_avg >= 0.6 else colors.red
+        summary_text = f'<font color="{summary_color.hexval()}"><b>Summary Agent Score: {_f3(summary_avg)}</b></font> ({len(summary_indices)} tests)'
+        story.append(Paragraph(summary_text, report_styles['summary_score']))
+        story.append(Spacer(1, 0.1*inch))
+        
+        # Summary metrics table
+        summary_data = [['Metric', 'Score', 'vs System Avg']] + [
+            agent_metric_row(metric, score) for metric, score in summary_scores.items()
+        ]
         
-        # Page break to agent-specific performance
-        story.append(PageBreak())
+        summary_table = LongTable(summary_data, colWidths=[3*inch, 1*inch, 1.5*inch], style=report_styles['summary_table'])
+        story.append(summary_table)
+        story.append(Spacer(1, 0.3*inch))
+    
+    # COMPARATIVE ANALYSIS
+    if needle_scores and summary_scores:
+        story.append(Paragraph("Comparative Analysis", heading_style))
+        
+        # Agent comparison table
+        comparison_data = [['Agent', 'Avg Score', 'Best Metric', 'Weakest Metric']]
+        
+        # Needle agent best/worst
+        needle_best, needle_worst = _best_worst(needle_scores)
+        comparison_data.append([
+            'Needle Agent',
+            _f3(needle_avg),
+            f'{metric_labels[needle_best[0]]}: {_f3(needle_best[1])}',
+            f'{metric_labels[needle_worst[0]]}: {_f3(needle_worst[1])}'
+        ])
+        
+        # Summary agent best/worst
+        summary_best, summary_worst = _best_worst(summary_scores)
+        comparison_data.append([
+            'Summary Agent',
+            _f3(summary_avg),
+            f'{metric_labels[summary_best[0]]}: {_f3(summary_best[1])}',
+            f'{metric_labels[summary_worst[0]]}: {_f3(summary_worst[1])}'
+        ])
+        
+        comparison_table = LongTable(comparison_data, colWidths=[1.5*inch, 1*inch, 2*inch, 2*inch],
+                                     style=report_styles['comparison_table'])
+        story.append(comparison_table)
+    
+    # Page break before detailed results
+    story.append(PageBreak())
+    
+    # DETAILED RESULTS PAGES
+    story.append(Paragraph("Detailed Test Results", title_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    # Format every test's scores in one pass ("N/A" for NaN)
+    score_matrix = results_df[METRIC_NAMES].to_numpy(dtype=np.float64)
+    score_texts = np.where(np.isnan(score_matrix), "N/A", np.char.mod("%.3f", score_matrix)).tolist()
+    score_labels = [METRIC_LABELS[metric] for metric in METRIC_NAMES]
+    
+    # Score tables hold one line of 10pt text per row (12pt leading + 3pt top/bottom
+    # padding), so fixed row heights skip the per-cell height measurement
+    test_row_heights = [18] * (len(METRIC_LABELS) + 1)
+    
+    for idx, eval_data in enumerate(eval_data_list):
+        # Scores table
+        test_scores_data = [['Metric', 'Score']] + [list(row) for row in zip(score_labels, score_texts[idx])]
         
-        # OVERVIEW PAGE 2: AGENT-SPECIFIC PERFORMANCE
-        story.append(Paragraph("Agent-Specific Performance", title_style))
-        story.append(Spacer(1, 0.2*inch))
+        test_table = LongTable(test_scores_data, colWidths=[3*inch, 1.5*inch],
+                               rowHeights=test_row_heights, style=report_styles['test_table'],
+                               spaceAfter=0.15*inch)
         
-        # NEEDLE AGENT PERFORMANCE
-        if needle_scores:
-            story.append(Paragraph("Needle Agent Performance", heading_style))
-            story.append(Paragraph(f"<i>Handles specific detail queries (needle-in-a-haystack)</i>", 
-                                  ParagraphStyle('Italic', parent=normal_style, fontSize=10, textColor=colors.grey)))
-            story.append(Spacer(1, 0.1*inch))
-            
-            needle_color = colors.green if needle_avg >= 0.8 else colors.orange if needle_avg >= 0.6 else colors.red
-            needle_text = f'<font color="{needle_color.hexval()}"><b>Needle Agent Score: {needle_avg:.3f}</b></font> ({len(needle_indices)} tests)'
-            story.append(Paragraph(needle_text, ParagraphStyle('NeedleScore', parent=normal_style, fontSize=14, spaceAfter=6)))
-            story.append(Spacer(1, 0.1*inch))
-            
-            # Needle metrics table
-            needle_data = [['Metric', 'Score', 'vs System Avg']]
-            for metric, score in needle_scores.items():
-                label = metric_labels[metric]
-                system_score = overall_scores[metric]
-                
-                # Handle NaN in scores
-                if score is None or (isinstance(score, float) and math.isnan(score)):
-                    needle_data.append([label, "N/A", "N/A"])
-                    continue
-                
-                if system_score is None or (isinstance(system_score, float) and math.isnan(system_score)):
-                    needle_data.append([label, f'{score:.3f}', "N/A"])
-                    continue
-                    
-                diff = score - system_score
-                if diff > 0.01:
-                    diff_text = Paragraph(f'<font color="green">+{diff:.3f}</font>', normal_style)
-                elif diff < -0.05:
-                    diff_text = Paragraph(f'<font color="red">{diff:.3f}</font>', normal_style)
-                else:
-                    diff_text = f'{diff:.3f}'
-                needle_data.append([label, f'{score:.3f}', diff_text])
-            
-            needle_table = Table(needle_data, colWidths=[3*inch, 1*inch, 1.5*inch])
-            needle_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e7d32')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#c8e6c9')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            story.append(needle_table)
-            story.append(Spacer(1, 0.3*inch))
-        
-        # SUMMARY AGENT PERFORMANCE
-        if summary_scores:
-            story.append(Paragraph("Summary Agent Performance", heading_style))
-            story.append(Paragraph(f"<i>Handles high-level overview queries</i>", 
-                                  ParagraphStyle('Italic', parent=normal_style, fontSize=10, textColor=colors.grey)))
-            story.append(Spacer(1, 0.1*inch))
-            
-            summary_color = colors.green if summary_avg >= 0.8 else colors.orange if summary_avg >= 0.6 else colors.red
-            summary_text = f'<font color="{summary_color.hexval()}"><b>Summary Agent Score: {summary_avg:.3f}</b></font> ({len(summary_indices)} tests)'
-            story.append(Paragraph(summary_text, ParagraphStyle('SummaryScore', parent=normal_style, fontSize=14, spaceAfter=6)))
-            story.append(Spacer(1, 0.1*inch))
-            
-            # Summary metrics table
-            summary_data = [['Metric', 'Score', 'vs System Avg']]
-            for metric, score in summary_scores.items():
-                label = metric_labels[metric]
-                system_score = overall_scores[metric]
-                
-                # Handle NaN in scores
-                if score is None or (isinstance(score, float) and math.isnan(score)):
-                    summary_data.append([label, "N/A", "N/A"])
-                    continue
-                
-                if system_score is None or (isinstance(system_score, float) and math.isnan(system_score)):
-                    summary_data.append([label, f'{score:.3f}', "N/A"])
-                    continue
-                
-                diff = score - system_score
-                if diff > 0.01:
-                    diff_text = Paragraph(f'<font color="green">+{diff:.3f}</font>', normal_style)
-                elif diff < -0.05:
-                    diff_text = Paragraph(f'<font color="red">{diff:.3f}</font>', normal_style)
-                else:
-                    diff_text = f'{diff:.3f}'
-                summary_data.append([label, f'{score:.3f}', diff_text])
-            
-            summary_table = Table(summary_data, colWidths=[3*inch, 1*inch, 1.5*inch])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1565c0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#bbdefb')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            story.append(summary_table)
-            story.append(Spacer(1, 0.3*inch))
-        
-        # COMPARATIVE ANALYSIS
-        if needle_scores and summary_scores:
-            story.append(Paragraph("Comparative Analysis", heading_style))
-            
-            # Agent comparison table
-            comparison_data = [['Agent', 'Avg Score', 'Best Metric', 'Weakest Metric']]
-            
-            # Needle agent best/worst
-            needle_best = max(needle_scores.items(), key=lambda x: x[1])
-            needle_worst = min(needle_scores.items(), key=lambda x: x[1])
-            comparison_data.append([
-                'Needle Agent',
-                f'{needle_avg:.3f}',
-                f'{metric_labels[needle_best[0]]}: {needle_best[1]:.3f}',
-                f'{metric_labels[needle_worst[0]]}: {needle_worst[1]:.3f}'
-            ])
-            
-            # Summary agent best/worst
-            summary_best = max(summary_scores.items(), key=lambda x: x[1])
-            summary_worst = min(summary_scores.items(), key=lambda x: x[1])
-            comparison_data.append([
-                'Summary Agent',
-                f'{summary_avg:.3f}',
-                f'{metric_labels[summary_best[0]]}: {summary_best[1]:.3f}',
-                f'{metric_labels[summary_worst[0]]}: {summary_worst[1]:.3f}'
-            ])
-            
-            comparison_table = Table(comparison_data, colWidths=[1.5*inch, 1*inch, 2*inch, 2*inch])
-            comparison_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            story.append(comparison_table)
-        
-        # Page break before detailed results
-        story.append(PageBreak())
-        
-        # DETAILED RESULTS PAGES
-        story.append(Paragraph("Detailed Test Results", title_style))
-        story.append(Spacer(1, 0.2*inch))
-        
-        for idx, eval_data in enumerate(eval_data_list):
-            row = results_df.iloc[idx]
-            
+        # All flowables for this test, added to the story in one extend
+        story.extend([
             # Test header
-            story.append(Paragraph(f"Test {idx+1}: {eval_data['test_id']}", heading_style))
+            Paragraph(f"Test {idx+1}: {eval_data['test_id']}", heading_style),
             
             # Question
-            story.append(Paragraph(f"<b>Question:</b> {eval_data['question']}", normal_style))
-            story.append(Spacer(1, 0.1*inch))
+            Paragraph(f"<b>Question:</b> {eval_data['question']}", detail_style),
             
             # Query type and routing
-            story.append(Paragraph(f"<b>Type:</b> {eval_data['query_type'].upper()} (routed to: {eval_data['routed_type'].upper()})", normal_style))
-            story.append(Spacer(1, 0.1*inch))
+            Paragraph(f"<b>Type:</b> {eval_data['query_type'].upper()} (routed to: {eval_data['routed_type'].upper()})", detail_style),
             
             # Ground truth - show full text
-            story.append(Paragraph(f"<b>Ground Truth:</b> {eval_data['ground_truth']}", normal_style))
-            story.append(Spacer(1, 0.1*inch))
+            Paragraph(f"<b>Ground Truth:</b> {eval_data['ground_truth']}", detail_style),
             
             # Agent answer - show full text
-            story.append(Paragraph(f"<b>Agent Answer:</b> {eval_data['answer']}", normal_style))
-            story.append(Spacer(1, 0.15*inch))
-            
-            # Scores table
-            test_scores_data = [['Metric', 'Score']]
+            Paragraph(f"<b>Agent Answer:</b> {eval_data['answer']}", report_styles['detail_last']),
             
-            # Helper to format score with NaN check
-            def format_test_score(value):
-                if value is None or (isinstance(value, float) and math.isnan(value)):
-                    return "N/A"
-                return f"{value:.3f}"
-            
-            test_scores_data.append(['Context Precision', format_test_score(row.get('context_precision'))])
-            test_scores_data.append(['Context Recall', format_test_score(row.get('context_recall'))])
-            test_scores_data.append(['Faithfulness', format_test_score(row.get('faithfulness'))])
-            test_scores_data.append(['Answer Relevancy', format_test_score(row.get('answer_relevancy'))])
-            test_scores_data.append(['Answer Similarity', format_test_score(row.get('answer_similarity'))])
-            test_scores_data.append(['Answer Correctness', format_test_score(row.get('answer_correctness'))])
-            
-            test_table = Table(test_scores_data, colWidths=[3*inch, 1.5*inch])
-            test_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ]))
-            story.append(test_table)
-            story.append(Spacer(1, 0.15*inch))
+            test_table,
             
             # Retrieved chunks - show all
-            chunks_text = f"<b>Retrieved:</b> {', '.join(eval_data['retrieved_chunk_ids'])}"
-            story.append(Paragraph(chunks_text, ParagraphStyle('Small', parent=normal_style, fontSize=9)))
+            Paragraph(f"<b>Retrieved:</b> {', '.join(eval_data['retrieved_chunk_ids'])}", small_style),
             
             # Expected chunks
-            expected_text = f"<b>Expected:</b> {', '.join(eval_data['expected_chunks'])}"
-            story.append(Paragraph(expected_text, ParagraphStyle('Small', parent=normal_style, fontSize=9)))
-            
-            # Add spacing between tests
-            if idx < len(eval_data_list) - 1:
-                story.append(Spacer(1, 0.2*inch))
-                # Subtle separator with lighter color
-                separator_style = ParagraphStyle('Separator', parent=normal_style, 
-                                                fontSize=8, textColor=colors.lightgrey)
-                story.append(Paragraph("─" * 40, separator_style))
-                story.append(Spacer(1, 0.15*inch))
-        
-        # Build PDF
-        doc.build(story)
-        
-        print(f"[OK] PDF report saved to: {output_path}")
-        return output_path
+            Paragraph(f"<b>Expected:</b> {', '.join(eval_data['expected_chunks'])}", small_style),
+        ])
+        
+        # Add spacing between tests
+        if idx < len(eval_data_list) - 1:
+            # Subtle separator with lighter color; the Spacer stays a flowable because a
+            # spaceAfter would absorb the next heading's spaceBefore
+            story.extend([
+                Paragraph("─" * 40, report_styles['separator']),
+                Spacer(1, 0.15*inch),
+            ])
+    
+    # Build PDF
+    doc.build(story)
+    
+    return output_path
 
 
-def run_query_phase():
+def run_query_phase(use_cache: bool = True, skip_routing: bool = None):
     """
     Phase 1: Run test queries through agents and save results.
     This phase is expensive (runs through OpenAI agents) but only needs to run once.
+    
+    Args:
+        use_cache: Reuse cached agent results from previous runs
+        skip_routing: Use each test case's query_type instead of the router (config default if None)
     """
     print("\n" + "=" * 70)
     print("PHASE 1: QUERY COLLECTION")
@@ -859,74 +1599,52 @@ def run_query_phase():
     print("  1. Load test dataset")
     print("  2. Run each query through your RAG system")
     print("  3. Capture answers and retrieved contexts")
-    print("  4. Save results to query_results.json")
+    print("  4. Save results to query_results.jsonl")
     print("\nEstimated time: 2-3 minutes")
     print("=" * 70)
     
     try:
         # Initialize evaluator (without Gemini judge yet)
         print("\n[PHASE 1] Initializing agents...")
-        evaluator = RAGASEvaluator()
+        evaluator = RAGASEvaluator(use_cache=use_cache, skip_routing=skip_routing)
         
         # Load test dataset
         test_cases = evaluator.load_test_dataset()
         
-        # Run all queries and collect data
+        # Run all queries in parallel, streaming each result to disk as it completes
         print("\n[PHASE 1] Running queries through agents...")
-        eval_data_list = []
-        
-        for idx, test_case in enumerate(test_cases, 1):
-            eval_data = evaluator.run_single_query(test_case, idx, len(test_cases))
-            eval_data_list.append(eval_data)
-        
-        # Save query results to JSON
-        output_path = "Evaluation/query_results.json"
-        output_data = {
-            'timestamp': datetime.now().isoformat(),
-            'total_queries': len(eval_data_list),
-            'test_cases': []
-        }
-        
-        for eval_data in eval_data_list:
-            test_result = {
-                'test_id': eval_data['test_id'],
-                'question': eval_data['question'],
-                'query_type': eval_data['query_type'],
-                'routed_type': eval_data['routed_type'],
-                'answer': eval_data['answer'],
-                'contexts': eval_data['contexts'],
-                'retrieved_chunk_ids': eval_data['retrieved_chunk_ids'],
-                'ground_truth': eval_data['ground_truth'],
-                'expected_chunks': eval_data['expected_chunks']
-            }
-            output_data['test_cases'].append(test_result)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        output_path = config.QUERY_RESULTS_PATH
+        with _QueryResultsWriter(output_path, len(test_cases)) as writer:
+            eval_data_list = evaluator.run_all_queries_parallel(test_cases, on_result=writer.write)
         
         print("\n" + "=" * 70)
         print("PHASE 1 COMPLETED SUCCESSFULLY!")
         print("=" * 70)
         print(f"\n[OK] Query results saved to: {output_path}")
         print(f"[OK] Processed {len(eval_data_list)} queries")
+        evaluator.cache.print_stats()
         print("\nNext step: Run 'Phase 2: Evaluation' to judge with Gemini")
-        
+    
     except Exception as e:
         print(f"\n[ERROR] Phase 1 failed: {e}")
         import traceback
         traceback.print_exc()
 
 
-def run_evaluation_phase():
+def run_evaluation_phase(use_cache: bool = True, compress: bool = True):
     """
     Phase 2: Load saved query results and evaluate with Gemini judge.
     This phase is fast and can be re-run with different configurations.
+    
+    Args:
+        use_cache: Reuse cached metric scores from previous runs
+        compress: Save evaluation results as zstd-compressed JSON
     """
     print("\n" + "=" * 70)
     print("PHASE 2: GEMINI EVALUATION")
     print("=" * 70)
     print("\nThis will:")
-    print("  1. Load query results from query_results.json")
+    print("  1. Load query results from query_results.jsonl")
     print("  2. Evaluate with Gemini using 6 RAGAS metrics")
     print("  3. Save evaluation scores")
     print("\nEstimated time: 2-3 minutes")
@@ -934,53 +1652,47 @@ def run_evaluation_phase():
     
     try:
         # Load query results
-        results_path = "Evaluation/query_results.json"
+        results_path = config.QUERY_RESULTS_PATH
         print(f"\n[PHASE 2] Loading query results from: {results_path}")
         
         try:
-            with open(results_path, 'r', encoding='utf-8') as f:
-                saved_data = json.load(f)
+            query_header, test_cases = _read_query_results(results_path)
         except FileNotFoundError:
             print(f"\n[ERROR] Query results not found at {results_path}")
             print("\nPlease run 'Phase 1: Query Collection' first!")
             return
         
-        test_cases = saved_data['test_cases']
         print(f"[PHASE 2] Loaded {len(test_cases)} query results")
+        total_queries = query_header.get('total_queries', len(test_cases))
+        if len(test_cases) < total_queries:
+            print(f"[WARNING] Query results are incomplete ({len(test_cases)} of "
+                  f"{total_queries}) - Phase 1 did not finish")
         
         # Initialize evaluator for Gemini judge
         print("\n[PHASE 2] Initializing Gemini judge...")
-        evaluator = RAGASEvaluator()
+        evaluator = RAGASEvaluator(use_cache=use_cache)
         
-        # Convert saved data to eval_data format
-        eval_data_list = []
-        for test_case in test_cases:
-            eval_data = {
-                'test_id': test_case['test_id'],
-                'question': test_case['question'],
-                'answer': test_case['answer'],
-                'contexts': test_case['contexts'],
-                'ground_truth': test_case['ground_truth'],
-                'query_type': test_case['query_type'],
-                'routed_type': test_case['routed_type'],
-                'expected_chunks': test_case['expected_chunks'],
-                'retrieved_chunk_ids': test_case['retrieved_chunk_ids']
-            }
-            eval_data_list.append(eval_data)
+        # Saved test cases already have the eval_data fields (nothing downstream mutates them)
+        eval_data_list = test_cases
         
         # Run RAGAS evaluation
         print("\n[PHASE 2] Running Gemini evaluation...")
         ragas_results = evaluator.evaluate_with_ragas(eval_data_list)
         
         if ragas_results is not None:
-            # Print detailed results
-            evaluator.print_detailed_results(eval_data_list, ragas_results)
+            results_df = ragas_results.to_pandas()
             
             # Save JSON results
-            evaluator.save_results(eval_data_list, ragas_results, config.EVALUATION_RESULTS_PATH)
+            evaluator.save_results(eval_data_list, results_df, config.EVALUATION_RESULTS_PATH,
+                                  compress=compress)
+            
+            # Render the PDF report in the background while printing results
+            evaluator.submit_pdf_report(eval_data_list, results_df, config.EVALUATION_REPORT_PATH)
             
-            # Generate PDF report
-            evaluator.generate_pdf_report(eval_data_list, ragas_results, config.EVALUATION_REPORT_PATH)
+            # Print detailed results
+            evaluator.print_detailed_results(eval_data_list, results_df)
+            
+            evaluator.wait_for_pdf_report()
             
             print("\n" + "=" * 70)
             print("PHASE 2 COMPLETED SUCCESSFULLY!")
@@ -994,8 +1706,15 @@ def run_evaluation_phase():
         traceback.print_exc()
 
 
-def run_full_evaluation():
-    """Main entry point for running RAGAS evaluation."""
+def run_full_evaluation(use_cache: bool = True, compress: bool = True, skip_routing: bool = None):
+    """
+    Main entry point for running RAGAS evaluation.
+    
+    Args:
+        use_cache: Reuse cached agent results and metric scores from previous runs
+        compress: Save evaluation results as zstd-compressed JSON
+        skip_routing: Use each test case's query_type instead of the router (config default if None)
+    """
     print("\n" + "=" * 70)
     print("RAGAS EVALUATION SYSTEM")
     print("=" * 70)
@@ -1011,41 +1730,34 @@ def run_full_evaluation():
     
     try:
         # Initialize evaluator
-        evaluator = RAGASEvaluator()
+        evaluator = RAGASEvaluator(use_cache=use_cache, skip_routing=skip_routing)
         
         # Load test dataset
         test_cases = evaluator.load_test_dataset()
         
-        # Run all queries and collect data
-        eval_data_list = []
-        
-        for idx, test_case in enumerate(test_cases, 1):
-            eval_data = evaluator.run_single_query(test_case, idx, len(test_cases))
-            eval_data_list.append(eval_data)
-        
-        # Save query results to query_results.json
+        # Run all queries in parallel, streaming each result to query_results.jsonl
         print(f"\n[SAVING] Saving query results to: {config.QUERY_RESULTS_PATH}")
-        with open(config.QUERY_RESULTS_PATH, 'w', encoding='utf-8') as f:
-            query_data = {
-                "timestamp": datetime.now().isoformat(),
-                "total_queries": len(eval_data_list),
-                "test_cases": eval_data_list
-            }
-            json.dump(query_data, f, indent=2, ensure_ascii=False)
+        with _QueryResultsWriter(config.QUERY_RESULTS_PATH, len(test_cases)) as writer:
+            eval_data_list = evaluator.run_all_queries_parallel(test_cases, on_result=writer.write)
         print(f"[OK] Query results saved")
         
         # Run RAGAS evaluation
         ragas_results = evaluator.evaluate_with_ragas(eval_data_list)
         
         if ragas_results is not None:
-            # Print detailed results
-            evaluator.print_detailed_results(eval_data_list, ragas_results)
+            results_df = ragas_results.to_pandas()
             
             # Save results to consistent filename
-            evaluator.save_results(eval_data_list, ragas_results, config.EVALUATION_RESULTS_PATH)
+            evaluator.save_results(eval_data_list, results_df, config.EVALUATION_RESULTS_PATH,
+                                  compress=compress)
             
-            # Generate PDF report to consistent filename
-            evaluator.generate_pdf_report(eval_data_list, ragas_results, config.EVALUATION_REPORT_PATH)
+            # Render the PDF report to consistent filename in the background while printing results
+            evaluator.submit_pdf_report(eval_data_list, results_df, config.EVALUATION_REPORT_PATH)
+            
+            # Print detailed results
+            evaluator.print_detailed_results(eval_data_list, results_df)
+            
+            evaluator.wait_for_pdf_report()
             
             print("\n" + "=" * 70)
             print("EVALUATION COMPLETED SUCCESSFULLY!")
@@ -1074,16 +1786,16 @@ def generate_pdf_from_existing():
     print("=" * 70)
     
     try:
-        # Check if evaluation results exist
-        if not os.path.exists(config.EVALUATION_RESULTS_PATH):
+        # Check if evaluation results exist (plain or compressed)
+        results_path = _resolve_results_path(config.EVALUATION_RESULTS_PATH)
+        if not os.path.exists(results_path):
             print(f"\n[ERROR] Evaluation results not found at {config.EVALUATION_RESULTS_PATH}")
             print("\nPlease run 'Phase 2: Evaluation Phase' first!")
             return
         
         # Load evaluation results
-        print(f"\n[PDF] Loading evaluation results from: {config.EVALUATION_RESULTS_PATH}")
-        with open(config.EVALUATION_RESULTS_PATH, 'r', encoding='utf-8') as f:
-            eval_results = json.load(f)
+        print(f"\n[PDF] Loading evaluation results from: {results_path}")
+        eval_results = _read_json(results_path)
         
         print(f"[PDF] Loaded evaluation for {eval_results['total_tests']} tests")
         print(f"[PDF] Evaluation timestamp: {eval_results.get('evaluation_timestamp', 'unknown')}")
@@ -1093,9 +1805,9 @@ def generate_pdf_from_existing():
         evaluator = RAGASEvaluator()
         
         # Reconstruct eval_data_list from saved results
-        eval_data_list = []
-        for test in eval_results['test_results']:
-            eval_data_list.append({
+        test_results = eval_results['test_results']
+        eval_data_list = [
+            {
                 'test_id': test['test_id'],
                 'question': test['question'],
                 'query_type': test['query_type'],
@@ -1104,32 +1816,21 @@ def generate_pdf_from_existing():
                 'ground_truth': test['ground_truth'],
                 'expected_chunks': test['expected_chunks'],
                 'retrieved_chunk_ids': test['retrieved_chunk_ids']
-            })
+            }
+            for test in test_results
+        ]
         
-        # Reconstruct ragas_results (mock pandas DataFrame)
+        # Reconstruct the scores DataFrame
         import pandas as pd
-        scores_data = []
-        for test in eval_results['test_results']:
-            scores_data.append(test['scores'])
-        ragas_results = pd.DataFrame(scores_data)
-        
-        # Create a simple object to mimic ragas results
-        class MockRagasResults:
-            def __init__(self, df):
-                self.df = df
-            
-            def to_pandas(self):
-                return self.df
-        
-        ragas_results = MockRagasResults(ragas_results)
+        results_df = pd.DataFrame.from_records([test['scores'] for test in test_results])
         
         # Generate PDF
-        evaluator.generate_pdf_report(eval_data_list, ragas_results, config.EVALUATION_REPORT_PATH)
+        evaluator.generate_pdf_report(eval_data_list, results_df, config.EVALUATION_REPORT_PATH)
         
         print("\n" + "=" * 70)
         print("PDF GENERATION COMPLETED!")
         print("=" * 70)
-        
+    
     except Exception as e:
         print(f"\n[ERROR] PDF generation failed: {str(e)}")
         import traceback
@@ -1137,5 +1838,18 @@ def generate_pdf_from_existing():
 
 
 if __name__ == "__main__":
-    run_full_evaluation()
+    parser = argparse.ArgumentParser(description="Run RAGAS evaluation with Gemini as the judge")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached agent results and metric scores and re-run everything")
+    parser.add_argument("--uncompressed", action="store_true",
+                        help="Save evaluation results as plain JSON instead of zstd-compressed .json.zst")
+    parser.add_argument("--skip-routing", action="store_true",
+                        help="Skip the routing agent and use each test case's expected query type")
+    args = parser.parse_args()
+    
+    run_full_evaluation(
+        use_cache=not args.no_cache,
+        compress=not args.uncompressed,
+        skip_routing=True if args.skip_routing else None
+    )
 
@@ -0,0 +1,151 @@
+"""
+Evaluation Cache for RAGAS Evaluation
+
+Persists agent query results and per-row RAGAS metric scores between runs so
+that unchanged test cases skip routing, retrieval, generation and judging.
+"""
+
+import hashlib
+import json
+import math
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class EvaluationCache:
+    """
+    JSON-backed cache for evaluation runs.
+    
+    Stores:
+    - Agent results keyed by sha256(system fingerprint + question)
+    - Metric scores keyed by sha256(judge + question + answer + contexts in retrieval
+      order + ground truth + metric)
+    """
+    
+    def __init__(self, cache_path: str, enabled: bool = True, fingerprint: str = "", judge: str = ""):
+        """
+        Initialize the cache and load any previously saved entries.
+        
+        Args:
+            cache_path: Path to the JSON cache file
+            enabled: When False, every lookup misses and nothing is written
+            fingerprint: Identifies the system under test (models, agents, indexes);
+                         agent results cached under a different fingerprint miss
+            judge: Identifies the scoring setup (judge LLM and RAGAS embedding model);
+                   scores cached under a different judge miss
+        """
+        self.cache_path = cache_path
+        self.enabled = enabled
+        self.fingerprint = fingerprint
+        self.judge = judge
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._data = {'queries': {}, 'scores': {}}
+        
+        if self.enabled:
+            self._load()
+    
+    def _load(self):
+        """Load cache entries from disk if the file exists."""
+        try:
+            raw = Path(self.cache_path).read_bytes()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw.decode('utf-8'))
+            self._data['queries'].update(data.get('queries', {}))
+            self._data['scores'].update(data.get('scores', {}))
+            print(f"[CACHE] Loaded {len(self._data['queries'])} query results and "
+                  f"{len(self._data['scores'])} scores from {self.cache_path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[WARNING] Could not load evaluation cache: {e}")
+    
+    def save(self):
+        """Write cache entries to disk."""
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            if ORJSON_AVAILABLE:
+                raw = orjson.dumps(self._data, option=orjson.OPT_INDENT_2)
+            else:
+                raw = json.dumps(self._data, indent=2, ensure_ascii=False).encode('utf-8')
+            Path(self.cache_path).write_bytes(raw)
+    
+    def query_key(self, question: str) -> str:
+        """Cache key for an agent query result of the current system."""
+        return hashlib.sha256(f"{self.fingerprint}\x00{question}".encode('utf-8')).hexdigest()
+    
+    def score_key(self, question: str, answer: str, contexts: List[str], ground_truth: str, metric: str) -> str:
+        """
+        Cache key for a single metric score of one test case.
+        
+        Contexts keep their retrieval order, since context_precision depends on rank.
+        """
+        raw = "\x00".join([self.judge, question, answer, "\x00".join(contexts), ground_truth, metric])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def _get(self, section: str, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            value = self._data[section].get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+    
+    def _set(self, section: str, key: str, value: Any):
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            self._data[section][key] = value
+    
+    def get_query(self, question: str) -> Optional[Dict[str, Any]]:
+        """Return the cached agent result for a question, or None."""
+        return self._get('queries', self.query_key(question))
+    
+    def set_query(self, question: str, result: Dict[str, Any]):
+        """Store the agent result for a question."""
+        self._set('queries', self.query_key(question), result)
+    
+    def get_score(self, key: str) -> Optional[float]:
+        """Return a cached metric score, or None."""
+        return self._get('scores', key)
+    
+    def set_score(self, key: str, score: Any):
+        """Store a metric score (NaN scores are skipped so they are retried next run)."""
+        if score is None or (isinstance(score, float) and math.isnan(score)):
+            return
+        self._set('scores', key, float(score))
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and entry counts."""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'hits': self.hits,
+                'misses': self.misses,
+                'queries': len(self._data['queries']),
+                'scores': len(self._data['scores'])
+            }
+    
+    def print_stats(self):
+        """Print a one-line cache summary."""
+        stats = self.stats()
+        if not stats['enabled']:
+            print("[CACHE] Disabled (--no-cache)")
+            return
+        print(f"[CACHE] {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['queries']} query results, {stats['scores']} scores stored)")
@@ -6,25 +6,215 @@ by analyzing each page and suggesting both needle (specific details) and
 summary (high-level) questions.
 """
 
+import argparse
+import hashlib
 import json
+import pickle
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from llama_index.core import SimpleDirectoryReader
-from openai import OpenAI
+# llama_index and openai are imported where they are used: they take seconds to
+# import and aren't needed for --help or when every completion is cached
 from Config import config
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def load_pdf_pages():
-    """Load PDF pages with metadata."""
+# Parses JSON text (str or UTF-8 bytes)
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+SYSTEM_PROMPT = "You are a helpful assistant that generates test questions for RAG evaluation."
+
+# Prompt templates (str.format; literal JSON braces are doubled)
+PAGE_BLOCK_TEMPLATE = """===PAGE {page_num} START===
+Page {page_num} - {header}
+Date: {date}
+Type: {type}
+
+Content:
+{content}
+===PAGE {page_num} END==="""
+
+# Needle questions (specific details)
+NEEDLE_PROMPT_TEMPLATE = """You are creating test questions for a RAG system evaluation.
+
+The pages below are each delimited by ===PAGE n START=== and ===PAGE n END=== markers.
+
+{page_blocks}
+
+For EACH page, generate {count_per_page} specific, factual "needle-in-a-haystack" question(s) that require precise details from that page.
+These should ask about:
+- Specific times, dates, or numbers
+- Names of people or organizations
+- Exact measurements or quantities
+- Specific locations or addresses
+- Precise medical findings or technical details
+
+For each question, provide:
+1. The question
+2. The exact answer (ground truth)
+3. A brief hint about where the answer is found (e.g., "mentioned in medical assessment")
+
+Format your response as JSON, with one entry per page:
+{{
+  "pages": [
+    {{
+      "page_number": 2,
+      "questions": [
+        {{
+          "question": "What time did X occur?",
+          "ground_truth_answer": "The exact answer from the text",
+          "location_hint": "Where in the page this appears"
+        }}
+      ]
+    }}
+  ]
+}}
+"""
+
+# Summary questions (high-level)
+SUMMARY_PROMPT_TEMPLATE = """You are creating test questions for a RAG system evaluation.
+
+The pages below are each delimited by ===PAGE n START=== and ===PAGE n END=== markers.
+
+{page_blocks}
+
+For EACH page, generate {count_per_page} high-level summary question(s) that require understanding the overall content of that page or multiple pages.
+These should ask about:
+- Overall outcomes or results
+- Key themes or main points
+- Relationships between events
+- Total costs or aggregated data
+- General timelines or sequences
+
+For each question, provide:
+1. The question
+2. The comprehensive answer (ground truth)
+3. A note about what pages might be relevant
+
+Format your response as JSON, with one entry per page:
+{{
+  "pages": [
+    {{
+      "page_number": 1,
+      "questions": [
+        {{
+          "question": "What was the overall outcome of X?",
+          "ground_truth_answer": "A comprehensive answer synthesizing the information",
+          "pages_involved": "Page X covers the main points..."
+        }}
+      ]
+    }}
+  ]
+}}
+"""
+
+
+def _response_schema(name, hint_field):
+    """
+    Strict JSON schema for a multi-page question response.
+    
+    Sent as a json_schema response_format so the API guarantees every field is
+    present, instead of a malformed reply failing later with a KeyError.
+    """
+    question = {
+        "type": "object",
+        "properties": {
+            "question": {"type": "string"},
+            "ground_truth_answer": {"type": "string"},
+            hint_field: {"type": "string"}
+        },
+        "required": ["question", "ground_truth_answer", hint_field],
+        "additionalProperties": False
+    }
+    page = {
+        "type": "object",
+        "properties": {
+            "page_number": {"type": "integer"},
+            "questions": {"type": "array", "items": question}
+        },
+        "required": ["page_number", "questions"],
+        "additionalProperties": False
+    }
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {"pages": {"type": "array", "items": page}},
+                "required": ["pages"],
+                "additionalProperties": False
+            }
+        }
+    }
+
+
+NEEDLE_RESPONSE_FORMAT = _response_schema("needle_questions", "location_hint")
+SUMMARY_RESPONSE_FORMAT = _response_schema("summary_questions", "pages_involved")
+
+
+def load_pdf_pages(use_cache=True):
+    """
+    Load PDF pages with metadata.
+    
+    Parsing is deterministic for a given PDF and metadata file, so the result
+    is pickled under QUESTION_PDF_CACHE_DIR, keyed by both files' modification
+    times, and reused until either file changes.
+    
+    Args:
+        use_cache: Reuse (and store) the parsed pages
+    """
+    cache_key = f"{Path(config.PDF_PATH).stat().st_mtime_ns}_{Path(config.METADATA_PATH).stat().st_mtime_ns}"
+    cache_path = Path(config.QUESTION_PDF_CACHE_DIR) / f"{cache_key}.pkl"
+    
+    if use_cache and cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                enriched_pages = pickle.load(f)
+            print(f"[CACHE] Loaded {len(enriched_pages)} parsed pages")
+            return enriched_pages
+        except Exception as e:
+            print(f"[WARNING] Could not load parsed pages: {e}")
+    
+    enriched_pages = _parse_pdf_pages()
+    
+    if use_cache:
+        # Pages parsed from older file versions are never read again
+        for stale_path in cache_path.parent.glob("*.pkl"):
+            stale_path.unlink()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(enriched_pages, f, protocol=5)
+    
+    return enriched_pages
+
+
+def _parse_pdf_pages():
+    """Parse the PDF and enrich each page with its metadata."""
+    from llama_index.core import SimpleDirectoryReader
+    
     print("[OK] Loading PDF pages...")
     
     # Load metadata
-    with open(config.METADATA_PATH, 'r', encoding='utf-8') as f:
-        metadata = json.load(f)
+    metadata = _json_loads(Path(config.METADATA_PATH).read_bytes())
     
     # Load PDF
     reader = SimpleDirectoryReader(
@@ -51,159 +241,456 @@ def load_pdf_pages():
     return enriched_pages
 
 
-def generate_questions_for_page(page, client, needle_count=1, summary_count=0):
+def _page_block(page):
+    """Format one page for a multi-page prompt, delimited by page markers."""
+    metadata = page['metadata']
+    return PAGE_BLOCK_TEMPLATE.format(
+        page_num=page['page_number'],
+        header=metadata['header'],
+        date=metadata['date'],
+        type=metadata['type'],
+        content=page['content'][:config.QGEN_MAX_PAGE_CHARS]
+    )
+
+
+def build_multi_page_request(pages, query_type, count_per_page):
     """
-    Generate candidate questions for a single page using OpenAI.
+    Build one chat completion request covering several pages.
+    
+    Args:
+        pages: Page dictionaries with content and metadata
+        query_type: 'needle' or 'summary'
+        count_per_page: Number of questions to generate for each page
+    
+    Returns:
+        Request kwargs for client.chat.completions.create
+    """
+    page_blocks = "\n\n".join(_page_block(page) for page in pages)
+    
+    if query_type == 'needle':
+        template, response_format = NEEDLE_PROMPT_TEMPLATE, NEEDLE_RESPONSE_FORMAT
+    else:
+        template, response_format = SUMMARY_PROMPT_TEMPLATE, SUMMARY_RESPONSE_FORMAT
+    prompt = template.format(page_blocks=page_blocks, count_per_page=count_per_page)
+    
+    return _chat_request(prompt, max_tokens=config.QGEN_MAX_TOKENS_PER_PAGE * len(pages),
+                         response_format=response_format)
+
+
+def create_client():
+    """
+    Create the client used for question generation.
+    
+    With LOCAL_LLM_URL set, requests go to that OpenAI-compatible server (for
+    example `vllm serve Qwen/Qwen2.5-7B-Instruct --port 8000`) instead of
+    OpenAI, which removes rate limits and per-token cost.
+    """
+    from openai import OpenAI
+    
+    if config.LOCAL_LLM_URL:
+        print(f"[OK] Using local LLM {config.LOCAL_QGEN_MODEL} at {config.LOCAL_LLM_URL}")
+        return OpenAI(base_url=config.LOCAL_LLM_URL, api_key="EMPTY")
+    return OpenAI(api_key=config.OPENAI_API_KEY)
+
+
+def _chat_request(prompt, max_tokens, response_format):
+    """Request kwargs shared by the synchronous and batch code paths."""
+    return {
+        'model': config.LOCAL_QGEN_MODEL if config.LOCAL_LLM_URL else config.QGEN_MODEL,
+        'messages': [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        'temperature': 0.3,
+        'max_tokens': max_tokens,
+        'response_format': response_format
+    }
+
+
+def _completion_cache_path(request):
+    """
+    Cache file for a completion request, or None if it shouldn't be cached.
+    
+    The key covers every request field that changes the completion (model,
+    temperature, messages, output token cap, response format).
+    """
+    if request.get('temperature', 1.0) > config.QUESTION_CACHE_MAX_TEMPERATURE:
+        return None
+    key_fields = [request['model'], request.get('temperature'), request['messages'],
+                  request.get('max_tokens'), request.get('response_format')]
+    key = hashlib.sha256(json.dumps(key_fields, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    return Path(config.QUESTION_CACHE_DIR) / f"{key}.json"
+
+
+def load_cached_completion(request):
+    """Return the cached message content for a request, or None."""
+    cache_path = _completion_cache_path(request)
+    if cache_path is None:
+        return None
+    try:
+        return _json_loads(cache_path.read_bytes())['content']
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[WARNING] Could not read cached completion {cache_path.name}: {e}")
+        return None
+
+
+def store_completion(request, content):
+    """Write the message content for a request to the completion cache."""
+    cache_path = _completion_cache_path(request)
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so a concurrent reader never sees a partial file
+    tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps({'content': content}, ensure_ascii=False), encoding='utf-8')
+    tmp_path.replace(cache_path)
+
+
+def _retry_after(error):
+    """Seconds the server asked us to wait (retry-after header), or None."""
+    response = getattr(error, 'response', None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _call_openai(client, request):
+    """
+    Run a chat completion, retrying transient failures with exponential backoff.
+    
+    Rate limits (429), server errors (5xx), connection errors and timeouts are
+    retried up to QUESTION_GEN_MAX_RETRIES times instead of dropping the
+    page's questions. A retry-after header from the server is honoured.
     
     Args:
-        page: Page dictionary with content and metadata
         client: OpenAI client
-        needle_count: Number of needle questions to generate
-        summary_count: Number of summary questions to generate
+        request: Request kwargs for client.chat.completions.create
     
     Returns:
-        List of question dictionaries
+        The completion response
     """
-    page_num = page['page_number']
-    content = page['content']
-    metadata = page['metadata']
+    from openai import RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+    
+    # Transient failures worth retrying (APITimeoutError is a subclass of APIConnectionError)
+    retryable_errors = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+    
+    delay = config.QUESTION_GEN_RETRY_BACKOFF
+    for attempt in range(config.QUESTION_GEN_MAX_RETRIES + 1):
+        try:
+            return client.chat.completions.create(**request)
+        except retryable_errors as e:
+            if attempt == config.QUESTION_GEN_MAX_RETRIES:
+                raise
+            wait = _retry_after(e)
+            wait = min(wait if wait is not None else delay, config.QUESTION_GEN_MAX_BACKOFF)
+            print(f"  [WARNING] {type(e).__name__} - retrying in {wait:.0f}s "
+                  f"({attempt + 1}/{config.QUESTION_GEN_MAX_RETRIES})")
+            time.sleep(wait)
+            delay = min(delay * 2, config.QUESTION_GEN_MAX_BACKOFF)
+
+
+def cached_chat(client, request, use_cache=True):
+    """
+    Run a chat completion request, reusing the cached response when there is one.
+    
+    Args:
+        client: OpenAI client
+        request: Request kwargs for client.chat.completions.create
+        use_cache: When False, always call the API and don't store the result
     
+    Returns:
+        Message content of the completion
+    """
+    if use_cache:
+        content = load_cached_completion(request)
+        if content is not None:
+            return content
+    
+    response = _call_openai(client, request)
+    content = response.choices[0].message.content
+    if use_cache:
+        store_completion(request, content)
+    return content
+
+
+def _format_questions(raw_questions, query_type, page_num):
+    """Turn the model's question objects for one page into question dictionaries."""
     questions = []
+    for q in raw_questions:
+        if query_type == 'needle':
+            questions.append({
+                'question': q['question'],
+                'ground_truth_answer': q['ground_truth_answer'],
+                'query_type': 'needle',
+                'source_page': page_num,
+                'location_hint': q.get('location_hint', ''),
+                'expected_chunks': [f"page_{page_num}_chunk_*"]  # User will refine
+            })
+        else:
+            questions.append({
+                'question': q['question'],
+                'ground_truth_answer': q['ground_truth_answer'],
+                'query_type': 'summary',
+                'source_page': page_num,
+                'pages_involved': q.get('pages_involved', ''),
+                'expected_chunks': [f"page_{page_num}_chunk_0"]  # User will refine
+            })
+    return questions
+
+
+def parse_multi_page_questions(response_text, query_type, pages):
+    """
+    Split a multi-page JSON completion into question dictionaries per page.
     
-    # Generate needle questions (specific details)
-    if needle_count > 0:
-        needle_prompt = f"""You are creating test questions for a RAG system evaluation.
+    Args:
+        response_text: Message content returned by the model
+        query_type: 'needle' or 'summary'
+        pages: Pages the request covered
+    
+    Returns:
+        One list of question dictionaries per page, in page order
+    """
+    by_page = {}
+    for entry in _json_loads(response_text)['pages']:
+        by_page.setdefault(entry['page_number'], []).extend(entry['questions'])
+    
+    return [_format_questions(by_page.get(page['page_number'], []), query_type, page['page_number'])
+            for page in pages]
 
-Page {page_num} - {metadata['header']}
-Date: {metadata['date']}
-Type: {metadata['type']}
 
-Content:
-{content}
+def generate_questions_multi_page(pages, client, kind, count_per_page, use_cache=True):
+    """
+    Generate candidate questions for several pages with a single OpenAI call.
+    
+    Args:
+        pages: Page dictionaries with content and metadata
+        client: OpenAI client
+        kind: 'needle' or 'summary'
+        count_per_page: Number of questions to generate for each page
+        use_cache: Reuse a cached completion for an identical request
+    
+    Returns:
+        One list of question dictionaries per page, in page order
+    """
+    if not pages:
+        return []
+    
+    try:
+        request = build_multi_page_request(pages, kind, count_per_page)
+        return parse_multi_page_questions(cached_chat(client, request, use_cache), kind, pages)
+    except Exception as e:
+        page_nums = ", ".join(str(page['page_number']) for page in pages)
+        print(f"[ERROR] Failed to generate {kind} questions for pages {page_nums}: {e}")
+        return [[] for _ in pages]
 
-Generate {needle_count} specific, factual "needle-in-a-haystack" question(s) that require precise details from this page.
-These should ask about:
-- Specific times, dates, or numbers
-- Names of people or organizations
-- Exact measurements or quantities
-- Specific locations or addresses
-- Precise medical findings or technical details
 
-For each question, provide:
-1. The question
-2. The exact answer (ground truth)
-3. A brief hint about where the answer is found (e.g., "mentioned in medical assessment")
+def generate_question_groups(groups, client, max_workers=None, use_cache=True):
+    """
+    Generate questions for several page groups concurrently.
+    
+    Each group is one independent, network-bound OpenAI request, so the groups
+    are sent in parallel on a thread pool.
+    
+    Args:
+        groups: (pages, kind, count_per_page) tuples for generate_questions_multi_page
+        client: OpenAI client (thread-safe, shared by all workers)
+        max_workers: Thread pool size (uses config default if None)
+        use_cache: Reuse cached completions for identical requests
+    
+    Returns:
+        One list of per-page question lists per group, in group order
+    """
+    if not groups:
+        return []
+    if max_workers is None:
+        max_workers = config.QUESTION_GEN_MAX_WORKERS
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+        return list(executor.map(
+            lambda group: generate_questions_multi_page(group[0], client, *group[1:], use_cache=use_cache),
+            groups
+        ))
 
-Format your response as JSON:
-{{
-  "questions": [
-    {{
-      "question": "What time did X occur?",
-      "ground_truth_answer": "The exact answer from the text",
-      "location_hint": "Where in the page this appears"
-    }}
-  ]
-}}
-"""
-        
+
+def generate_questions_batch(groups, client, poll_interval=None, use_cache=True):
+    """
+    Generate questions for all page groups with a single OpenAI Batch API job.
+    
+    Batch requests cost half as much as synchronous ones and don't count against
+    the synchronous rate limits, but complete asynchronously (within 24 hours,
+    usually minutes), so this polls until the batch has finished.
+    
+    Args:
+        groups: (pages, kind, count_per_page) tuples, one request each
+        client: OpenAI client
+        poll_interval: Seconds between status checks (uses config default if None)
+        use_cache: Answer cached requests locally and only submit the rest
+    
+    Returns:
+        One list of per-page question lists per group, in group order
+    """
+    if poll_interval is None:
+        poll_interval = config.QUESTION_BATCH_POLL_INTERVAL
+    
+    results = [[[] for _ in pages] for pages, _, _ in groups]
+    
+    # One JSONL line per uncached group; custom_id maps each result back to its group
+    lines = []
+    requests = {}
+    for group_idx, (pages, kind, count_per_page) in enumerate(groups):
+        if not pages:
+            continue
+        request = build_multi_page_request(pages, kind, count_per_page)
+        cached = load_cached_completion(request) if use_cache else None
+        if cached is not None:
+            results[group_idx] = parse_multi_page_questions(cached, kind, pages)
+            continue
+        requests[group_idx] = request
+        lines.append(json.dumps({
+            "custom_id": f"{kind}_{group_idx}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": request
+        }, ensure_ascii=False))
+    
+    if not lines:
+        return results
+    
+    batch_file = client.files.create(
+        file=("question_batch.jsonl", "\n".join(lines).encode('utf-8')),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"[BATCH] Submitted {len(lines)} requests as batch {batch.id}")
+    
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        print(f"[BATCH] Status: {batch.status}")
+    
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+    
+    # Output lines arrive in any order; failed requests are only in the error file
+    responses = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if line.strip():
+                item = _json_loads(line)
+                responses[item['custom_id']] = item
+    
+    for group_idx, request in requests.items():
+        pages, kind, _ = groups[group_idx]
         try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that generates test questions for RAG evaluation."},
-                    {"role": "user", "content": needle_prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            
-            for q in result.get('questions', []):
-                questions.append({
-                    'question': q['question'],
-                    'ground_truth_answer': q['ground_truth_answer'],
-                    'query_type': 'needle',
-                    'source_page': page_num,
-                    'location_hint': q.get('location_hint', ''),
-                    'expected_chunks': [f"page_{page_num}_chunk_*"]  # User will refine
-                })
-        
+            item = responses.get(f"{kind}_{group_idx}")
+            if item is None or item.get('error') or item['response']['status_code'] != 200:
+                raise RuntimeError(item.get('error') if item else "no result in batch output")
+            content = item['response']['body']['choices'][0]['message']['content']
+            results[group_idx] = parse_multi_page_questions(content, kind, pages)
+            if use_cache:
+                store_completion(request, content)
         except Exception as e:
-            print(f"[ERROR] Failed to generate needle questions for page {page_num}: {e}")
+            page_nums = ", ".join(str(page['page_number']) for page in pages)
+            print(f"[ERROR] Failed to generate {kind} questions for pages {page_nums}: {e}")
     
-    # Generate summary questions (high-level)
-    if summary_count > 0:
-        summary_prompt = f"""You are creating test questions for a RAG system evaluation.
+    return results
 
-Page {page_num} - {metadata['header']}
-Date: {metadata['date']}
-Type: {metadata['type']}
 
-Content:
-{content}
+def _count_tokens(text, model):
+    """Count tokens with tiktoken, or estimate ~4 characters per token without it."""
+    if not TIKTOKEN_AVAILABLE:
+        return len(text) // 4
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("o200k_base")  # Encoding of the gpt-4o/4.1 families
+    return len(encoding.encode(text))
 
-Generate {summary_count} high-level summary question(s) that require understanding the overall content of this page or multiple pages.
-These should ask about:
-- Overall outcomes or results
-- Key themes or main points
-- Relationships between events
-- Total costs or aggregated data
-- General timelines or sequences
 
-For each question, provide:
-1. The question
-2. The comprehensive answer (ground truth)
-3. A note about what pages might be relevant
+def estimate_cost(groups, use_cache=True, use_batch=False):
+    """
+    Print the input tokens and projected cost of the requests a run will send.
+    
+    Requests already in the completion cache are free and not counted.
+    
+    Args:
+        groups: (pages, kind, count_per_page) tuples, one request each
+        use_cache: Whether cached completions will be reused
+        use_batch: Whether the requests go through the Batch API (half price)
+    
+    Returns:
+        (input_tokens, max_output_tokens, estimated_cost_usd)
+    """
+    input_tokens = 0
+    max_output_tokens = 0
+    sent = 0
+    for pages, kind, count_per_page in groups:
+        if not pages:
+            continue
+        request = build_multi_page_request(pages, kind, count_per_page)
+        if use_cache and load_cached_completion(request) is not None:
+            continue
+        sent += 1
+        input_tokens += sum(_count_tokens(m['content'], request['model']) for m in request['messages'])
+        max_output_tokens += request['max_tokens']
+    
+    if config.LOCAL_LLM_URL:
+        cost = 0.0
+    else:
+        cost = (input_tokens * config.QGEN_INPUT_COST_PER_1M +
+                max_output_tokens * config.QGEN_OUTPUT_COST_PER_1M) / 1_000_000
+        if use_batch:
+            cost /= 2
+    
+    method = "tiktoken" if TIKTOKEN_AVAILABLE else "~4 chars/token"
+    print(f"[OK] {sent} request(s) to send: {input_tokens} input tokens ({method}), "
+          f"at most {max_output_tokens} output tokens; at most ${cost:.4f}")
+    return input_tokens, max_output_tokens, cost
 
-Format your response as JSON:
-{{
-  "questions": [
-    {{
-      "question": "What was the overall outcome of X?",
-      "ground_truth_answer": "A comprehensive answer synthesizing the information",
-      "pages_involved": "Page X covers the main points..."
-    }}
-  ]
-}}
-"""
-        
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that generates test questions for RAG evaluation."},
-                    {"role": "user", "content": summary_prompt}
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(response.choices[0].message.content)
-            
-            for q in result.get('questions', []):
-                questions.append({
-                    'question': q['question'],
-                    'ground_truth_answer': q['ground_truth_answer'],
-                    'query_type': 'summary',
-                    'source_page': page_num,
-                    'pages_involved': q.get('pages_involved', ''),
-                    'expected_chunks': [f"page_{page_num}_chunk_0"]  # User will refine
-                })
-        
-        except Exception as e:
-            print(f"[ERROR] Failed to generate summary questions for page {page_num}: {e}")
+
+def _select_pages(pages_by_num, page_nums):
+    """Return the pages with the given numbers, in that order, listing them in one write."""
+    selected = [pages_by_num[page_num] for page_num in page_nums if page_num in pages_by_num]
+    if selected:
+        print("\n".join(f"  Page {page['page_number']}: {page['metadata']['header'][:50]}..." for page in selected))
+    return selected
+
+
+def _extend_until(all_questions, page_results, query_type, target):
+    """
+    Add per-page results in page order until target questions of query_type are collected.
     
-    return questions
+    Returns:
+        Number of query_type questions added
+    """
+    count = 0
+    for questions in page_results:
+        all_questions.extend(questions)
+        count += sum(1 for q in questions if q['query_type'] == query_type)
+        if count >= target:
+            break
+    return count
 
 
-def generate_test_questions(target_needle=5, target_summary=5):
+def generate_test_questions(target_needle=5, target_summary=5, use_batch=False, use_cache=True,
+                            dry_run=False):
     """
     Generate a balanced set of test questions.
     
     Args:
         target_needle: Target number of needle questions
         target_summary: Target number of summary questions
+        use_batch: Submit all requests as one OpenAI Batch API job (half price, slower)
+        use_cache: Reuse parsed pages and cached completions from previous runs
+        dry_run: Only print the projected token count and cost; send nothing
     
     Returns:
         List of all generated questions
@@ -212,11 +699,15 @@ def generate_test_questions(target_needle=5, target_summary=5):
     print("SEMI-AUTOMATIC QUESTION GENERATOR")
     print("=" * 70)
     
-    # Initialize OpenAI client
-    client = OpenAI(api_key=config.OPENAI_API_KEY)
+    # Initialize OpenAI (or local OpenAI-compatible) client
+    client = create_client()
+    if use_batch and config.LOCAL_LLM_URL:
+        print("[WARNING] The Batch API is OpenAI-only - sending requests to the local LLM directly")
+        use_batch = False
     
     # Load pages
-    pages = load_pdf_pages()
+    pages = load_pdf_pages(use_cache=use_cache)
+    pages_by_num = {p['page_number']: p for p in pages}
     
     # Strategy: Generate questions from key pages
     # Needle questions: Spread across different detail pages (pages 2-9)
@@ -224,41 +715,47 @@ def generate_test_questions(target_needle=5, target_summary=5):
     
     all_questions = []
     
-    print("\n[STEP 1] Generating needle questions...")
+    print("\n[STEP 1] Selecting pages...")
     print("-" * 70)
     
     # Pages with rich specific details for needle questions
     needle_pages = [2, 3, 4, 5, 7]  # Different event pages
-    questions_per_page = max(1, target_needle // len(needle_pages))
+    needle_per_page = max(1, target_needle // len(needle_pages))
+    needle_selected = _select_pages(pages_by_num, needle_pages)
+    
+    # Pages for summary questions
+    summary_pages = [1, 6, 8, 10]  # Overview + key detail pages
+    summary_per_page = max(1, target_summary // len(summary_pages))
+    summary_selected = _select_pages(pages_by_num, summary_pages)
     
-    for page_num in needle_pages:
-        page = next((p for p in pages if p['page_number'] == page_num), None)
-        if page:
-            print(f"  Generating for Page {page_num}: {page['metadata']['header'][:50]}...")
-            questions = generate_questions_for_page(page, client, needle_count=questions_per_page)
-            all_questions.extend(questions)
-            if len([q for q in all_questions if q['query_type'] == 'needle']) >= target_needle:
-                break
+    # One multi-page request per group instead of one request per page.
+    # Summary pages also contribute one needle question each, as they always have.
+    groups = [
+        (needle_selected, 'needle', needle_per_page),
+        (summary_selected, 'summary', summary_per_page),
+        (summary_selected, 'needle', 1)
+    ]
     
-    print(f"\n[OK] Generated {len([q for q in all_questions if q['query_type'] == 'needle'])} needle questions")
+    estimate_cost(groups, use_cache=use_cache, use_batch=use_batch)
+    if dry_run:
+        print("[OK] Dry run - no requests sent")
+        return all_questions
     
-    print("\n[STEP 2] Generating summary questions...")
+    print("\n[STEP 2] Generating questions...")
     print("-" * 70)
     
-    # Pages for summary questions
-    summary_pages = [1, 6, 8, 10]  # Overview + key detail pages
-    questions_per_page = max(1, target_summary // len(summary_pages))
+    if use_batch:
+        results = generate_questions_batch(groups, client, use_cache=use_cache)
+    else:
+        results = generate_question_groups(groups, client, use_cache=use_cache)
+    needle_results, summary_results, summary_page_needles = results
     
-    for page_num in summary_pages:
-        page = next((p for p in pages if p['page_number'] == page_num), None)
-        if page:
-            print(f"  Generating for Page {page_num}: {page['metadata']['header'][:50]}...")
-            questions = generate_questions_for_page(page, client, summary_count=questions_per_page)
-            all_questions.extend(questions)
-            if len([q for q in all_questions if q['query_type'] == 'summary']) >= target_summary:
-                break
+    needle_count = _extend_until(all_questions, needle_results, 'needle', target_needle)
+    print(f"\n[OK] Generated {needle_count} needle questions")
     
-    print(f"\n[OK] Generated {len([q for q in all_questions if q['query_type'] == 'summary'])} summary questions")
+    summary_page_results = [needles + summaries for needles, summaries in zip(summary_page_needles, summary_results)]
+    summary_count = _extend_until(all_questions, summary_page_results, 'summary', target_summary)
+    print(f"[OK] Generated {summary_count} summary questions")
     
     return all_questions
 
@@ -294,8 +791,11 @@ def save_suggested_questions(questions, output_file="Evaluation/suggested_questi
         "test_cases": formatted_questions
     }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        raw = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(output_data, indent=2, ensure_ascii=False).encode('utf-8')
+    Path(output_file).write_bytes(raw)
     
     print(f"\n[OK] Saved suggested questions to: {output_file}")
     print("\nNext steps:")
@@ -306,10 +806,22 @@ def save_suggested_questions(questions, output_file="Evaluation/suggested_questi
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate candidate test questions for RAGAS evaluation")
+    parser.add_argument("--batch", action="store_true",
+                        help="Submit all pages as one OpenAI Batch API job (half price, may take minutes)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse the PDF and call OpenAI for every request, ignoring caches")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the projected token count and cost without calling the API")
+    args = parser.parse_args()
+    
     print("\nGenerating test questions for RAGAS evaluation...")
     
     try:
-        questions = generate_test_questions(target_needle=5, target_summary=5)
+        questions = generate_test_questions(target_needle=5, target_summary=5, use_batch=args.batch,
+                                            use_cache=not args.no_cache, dry_run=args.dry_run)
+        if args.dry_run:
+            sys.exit(0)
         
         print("\n" + "=" * 70)
         print(f"GENERATED {len(questions)} QUESTIONS TOTAL")
@@ -0,0 +1,155 @@
+"""
+Semantic Cache for RAGAS Evaluation
+
+Reuses agent results for questions that are near-duplicates of questions seen
+in earlier runs (rephrasings, copied test cases), which an exact hash cache
+misses. Questions are embedded with a small local model and looked up in an
+HNSW index; a hit above the similarity threshold skips retrieval and
+generation entirely.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+try:
+    from fastembed import TextEmbedding
+    FASTEMBED_AVAILABLE = True
+except ImportError:
+    FASTEMBED_AVAILABLE = False
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache of agent results backed by an hnswlib index.
+    
+    Index labels are positions in the entries list, which is persisted next to
+    the index as JSON together with the fingerprint of the system that
+    produced the results.
+    """
+    
+    def __init__(self, index_path: str, entries_path: str, threshold: float,
+                 model_name: str, dim: int = 384, max_elements: int = 10000,
+                 enabled: bool = True, fingerprint: str = ""):
+        """
+        Initialize the semantic cache and load any previously saved index.
+        
+        Args:
+            index_path: Path to the saved hnswlib index
+            entries_path: Path to the JSON file with cached questions and results
+            threshold: Minimum cosine similarity for a cache hit
+            model_name: fastembed model used to embed questions
+            dim: Embedding dimension of the model
+            max_elements: Index capacity
+            enabled: When False, every lookup misses and nothing is written
+            fingerprint: Identifies the system under test; a saved index built
+                         under a different fingerprint is discarded
+        """
+        self.index_path = index_path
+        self.entries_path = entries_path
+        self.threshold = threshold
+        self.model_name = model_name
+        self.dim = dim
+        self.max_elements = max_elements
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._embedder = None
+        self._entries = []
+        
+        self.enabled = enabled and HNSWLIB_AVAILABLE and FASTEMBED_AVAILABLE
+        if enabled and not self.enabled:
+            print("[WARNING] hnswlib/fastembed not installed - semantic cache disabled")
+        
+        if self.enabled:
+            self._index = hnswlib.Index(space='cosine', dim=dim)
+            self._load()
+    
+    def _load(self):
+        """Load the index and its entries from disk, or start an empty index."""
+        if Path(self.index_path).exists() and Path(self.entries_path).exists():
+            try:
+                with open(self.entries_path, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                if isinstance(saved, dict) and saved.get('fingerprint') == self.fingerprint:
+                    self._entries = saved['entries']
+                    self._index.load_index(self.index_path, max_elements=self.max_elements)
+                    self._index.set_ef(50)
+                    print(f"[CACHE] Loaded semantic index with {len(self._entries)} questions")
+                    return
+                # Results of an older system (re-indexed, other agents or models)
+                print("[CACHE] Semantic index was built for a different system - starting fresh")
+            except Exception as e:
+                print(f"[WARNING] Could not load semantic cache: {e}")
+                self._entries = []
+                self._index = hnswlib.Index(space='cosine', dim=self.dim)
+        
+        self._index.init_index(max_elements=self.max_elements, ef_construction=200, M=16)
+        self._index.set_ef(50)
+    
+    def _embed(self, question: str):
+        """Embed a question with the local model (loaded on first use)."""
+        if self._embedder is None:
+            self._embedder = TextEmbedding(model_name=self.model_name)
+        return next(iter(self._embedder.embed([question])))
+    
+    def lookup(self, question: str) -> Optional[Tuple[Dict[str, Any], float, str]]:
+        """
+        Find the cached result of the most similar previous question.
+        
+        Args:
+            question: Question to look up
+        
+        Returns:
+            (result, similarity, matched_question) on a hit, otherwise None
+        """
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            if not self._entries:
+                return None
+            
+            labels, distances = self._index.knn_query(self._embed(question), k=1)
+            similarity = 1.0 - float(distances[0][0])
+            if similarity < self.threshold:
+                return None
+            
+            self.hits += 1
+            entry = self._entries[int(labels[0][0])]
+            return entry['result'], similarity, entry['question']
+    
+    def add(self, question: str, result: Dict[str, Any]):
+        """
+        Index a question and store its agent result.
+        
+        The evaluator calls this after a run has finished, so lookups during
+        a run only match questions answered in earlier runs.
+        """
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            if len(self._entries) >= self.max_elements:
+                return
+            self._index.add_items(self._embed(question), len(self._entries))
+            self._entries.append({'question': question, 'result': result})
+    
+    def save(self):
+        """Write the index and entries to disk."""
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
+            self._index.save_index(self.index_path)
+            with open(self.entries_path, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': self.fingerprint, 'entries': self._entries},
+                          f, indent=2, ensure_ascii=False)
@@ -4,18 +4,56 @@ Runs both needle and summary indexing systems
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 
 # Handle imports for both module execution and direct script execution
 try:
     from Indexing.needle_indexing import create_needle_index
     from Indexing.summary_indexing import create_summary_index
+    from Indexing.pdf_loader import load_pdf_with_metadata
 except ModuleNotFoundError:
     from needle_indexing import create_needle_index
     from summary_indexing import create_summary_index
+    from pdf_loader import load_pdf_with_metadata
+
+from Config import config
+
+
+def create_indexes_in_parallel(pages):
+    """
+    Create the needle and summary indexes concurrently.
+    
+    The two builders write to independent Supabase tables and spend most of
+    their time waiting on OpenAI and the database, so running them on two
+    threads roughly halves the wall time. Their progress output interleaves.
+    
+    If one builder raises, the other is cancelled if it hasn't started yet
+    (a running builder can't be interrupted and finishes in the background)
+    and the exception is re-raised immediately.
+    
+    Args:
+        pages: Page documents shared by both builders
+    
+    Returns:
+        ((needle_index, docstore), summary_index)
+    """
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        needle_future = executor.submit(create_needle_index, pages)
+        summary_future = executor.submit(create_summary_index, pages)
+        
+        done, _ = wait([needle_future, summary_future], return_when=FIRST_EXCEPTION)
+        for future in done:
+            if future.exception() is not None:
+                raise future.exception()
+        
+        return needle_future.result(), summary_future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
-    """Create all indexes in sequence"""
+    """Create all indexes (in sequence, or concurrently with PARALLEL_INDEXING=1)"""
     print("\n" + "=" * 70)
     print("INSURANCE CLAIM INDEXING SYSTEM")
     print("Creating all indexes...")
@@ -35,7 +73,14 @@ def main():
         except ModuleNotFoundError:
             from supabase_setup import ensure_tables_exist
         
-        if not ensure_tables_exist(force_recreate=True):
+        # Parse the PDF in the background while the database tables are
+        # recreated; both indexes are later built from the same pages
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pages_future = executor.submit(load_pdf_with_metadata)
+            tables_ready = ensure_tables_exist(force_recreate=True)
+            pages = pages_future.result()
+        
+        if not tables_ready:
             print("\n" + "="*70)
             print("[ABORTED] Database setup failed.")
             print("="*70)
@@ -49,27 +94,42 @@ def main():
         print("DATABASE SETUP COMPLETE - Proceeding with indexing...")
         print("="*70)
         
-        # Step 1: Create needle index
-        print("\n[STEP 1/2] Creating Needle Index...")
-        print("-" * 70)
-        needle_index, docstore = create_needle_index()
-        
-        if needle_index is None:
-            print("\n[ABORTED] Needle index creation failed.")
-            return None, None
-        
-        print("\n[OK] Needle index created successfully!")
-        
-        # Step 2: Create summary index
-        print("\n[STEP 2/2] Creating Summary Index...")
-        print("-" * 70)
-        summary_index = create_summary_index()
-        
-        if summary_index is None:
-            print("\n[ABORTED] Summary index creation failed.")
-            return None, None
-        
-        print("\n[OK] Summary index created successfully!")
+        if config.PARALLEL_INDEXING:
+            # Steps 1+2: Create needle and summary indexes concurrently
+            print("\n[STEP 1-2/2] Creating Needle and Summary Indexes in parallel...")
+            print("-" * 70)
+            (needle_index, docstore), summary_index = create_indexes_in_parallel(pages)
+            
+            if needle_index is None:
+                print("\n[ABORTED] Needle index creation failed.")
+                return None, None
+            if summary_index is None:
+                print("\n[ABORTED] Summary index creation failed.")
+                return None, None
+            
+            print("\n[OK] Needle and summary indexes created successfully!")
+        else:
+            # Step 1: Create needle index
+            print("\n[STEP 1/2] Creating Needle Index...")
+            print("-" * 70)
+            needle_index, docstore = create_needle_index(pages)
+            
+            if needle_index is None:
+                print("\n[ABORTED] Needle index creation failed.")
+                return None, None
+            
+            print("\n[OK] Needle index created successfully!")
+            
+            # Step 2: Create summary index
+            print("\n[STEP 2/2] Creating Summary Index...")
+            print("-" * 70)
+            summary_index = create_summary_index(pages)
+            
+            if summary_index is None:
+                print("\n[ABORTED] Summary index creation failed.")
+                return None, None
+            
+            print("\n[OK] Summary index created successfully!")
         
         # Final summary
         print("\n" + "=" * 70)
@@ -0,0 +1,94 @@
+"""
+Embedding Cache for the Indexing System
+Content-addressed SQLite store of chunk embeddings, so re-indexing an unchanged PDF
+doesn't pay for the same OpenAI embedding requests again
+"""
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import List, Optional
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache keyed by sha256(model + NUL + text).
+    
+    Vectors are stored as packed float64 arrays, so cached embeddings are
+    bit-identical to the ones returned by the API.
+    """
+    
+    def __init__(self, cache_path: str, model: str, enabled: bool = True):
+        """
+        Initialize the cache, creating the database file if needed.
+        
+        Args:
+            cache_path: Path to the SQLite database file
+            model: Embedding model name (part of every key)
+            enabled: When False, every lookup misses and nothing is written
+        """
+        self.cache_path = cache_path
+        self.model = model
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        
+        if self.enabled:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB NOT NULL)")
+            self._conn.commit()
+    
+    def key(self, text: str) -> bytes:
+        """Cache key for a text embedded with this cache's model."""
+        return hashlib.sha256(f"{self.model}\0{text}".encode('utf-8')).digest()
+    
+    def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Return the cached embedding for each text, or None where there is none."""
+        if not self.enabled:
+            return [None] * len(texts)
+        
+        keys = [self.key(text) for text in texts]
+        with self._lock:
+            found = {}
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                for key, vec in self._conn.execute(
+                        f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})", batch):
+                    found[key] = array('d', vec).tolist()
+            
+            results = [found.get(key) for key in keys]
+            hits = sum(1 for result in results if result is not None)
+            self.hits += hits
+            self.misses += len(results) - hits
+            return results
+    
+    def put_many(self, texts: List[str], embeddings: List[List[float]]):
+        """Store embeddings for the given texts."""
+        if not self.enabled or not texts:
+            return
+        
+        rows = [(self.key(text), array('d', embedding).tobytes()) for text, embedding in zip(texts, embeddings)]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (hash, vec) VALUES (?, ?)", rows)
+            self._conn.commit()
+    
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
+            self.enabled = False
+    
+    def print_stats(self):
+        """Print a one-line cache summary."""
+        if not self.enabled:
+            return
+        print(f"[CACHE] Embeddings: {self.hits} hits, {self.misses} misses")
@@ -3,23 +3,56 @@ Needle Indexing with Auto-Merging Retrieval
 Creates small chunks stored in Supabase vector store, with parent pages in local document store
 """
 
+import bisect
 import json
 import re
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+import multiprocessing
+from typing import List, Dict, Tuple
+import numpy as np
 from llama_index.core import Document, VectorStoreIndex, StorageContext, Settings
 from llama_index.core.node_parser import SentenceSplitter
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.llms.openai import OpenAI
 from llama_index.core.storage.docstore import SimpleDocumentStore
-from llama_index.readers.file import PyMuPDFReader
 from supabase import create_client, Client
 
 # Handle imports for both module execution and direct script execution
 from Config import config
 
+try:
+    from Indexing.pdf_loader import load_pdf_with_metadata
+    from Indexing.embedding_cache import EmbeddingCache
+except ModuleNotFoundError:
+    from pdf_loader import load_pdf_with_metadata
+    from embedding_cache import EmbeddingCache
+
 # Configure LlamaIndex settings
 Settings.llm = OpenAI(model=config.SUMMARY_MODEL, temperature=config.TEMPERATURE, api_key=config.OPENAI_API_KEY)
-Settings.embed_model = OpenAIEmbedding(model=config.EMBEDDING_MODEL, api_key=config.OPENAI_API_KEY)
+
+# One embedding client (and HTTP connection pool) shared by indexing and both storage paths
+EMBED_MODEL = OpenAIEmbedding(model=config.EMBEDDING_MODEL, api_key=config.OPENAI_API_KEY,
+                              embed_batch_size=config.EMBEDDING_BATCH_SIZE)
+Settings.embed_model = EMBED_MODEL
+
+
+# Common abbreviations whose periods don't end a sentence
+ABBREVIATIONS = [
+    'Mr.', 'Mrs.', 'Ms.', 'Dr.', 'Prof.', 'Sr.', 'Jr.', 'Inc.', 'Ltd.', 'Co.', 'Corp.',
+    'etc.', 'vs.', 'e.g.', 'i.e.', 'Ph.D.', 'M.D.',
+]
+
+# Split on sentence-ending punctuation followed by space and capital letter
+# Pattern: period/exclamation/question mark (not ending an abbreviation), then
+# space(s), then capital or quote+capital. Python's re only allows fixed-width
+# lookbehinds, so each abbreviation gets its own. A lowercase abbreviation
+# (e.g., i.e., etc., vs.) may also start the next sentence.
+SENTENCE_SPLIT_RE = re.compile(
+    "".join(f"(?<!{re.escape(abbrev)})" for abbrev in ABBREVIATIONS) +
+    r'(?<=[.!?])\s+(?=[A-Z"\']|' +
+    "|".join(re.escape(abbrev) for abbrev in ABBREVIATIONS if abbrev[0].islower()) + ")"
+)
 
 
 def split_into_sentences(text: str) -> List[str]:
@@ -27,78 +60,95 @@ def split_into_sentences(text: str) -> List[str]:
     Split text into sentences using a simple but effective approach.
     Handles common abbreviations and edge cases.
     """
-    # Replace common abbreviations with placeholders to protect them
-    protected = text
-    abbreviations = {
-        'Mr.': 'MR_PLACEHOLDER',
-        'Mrs.': 'MRS_PLACEHOLDER',
-        'Ms.': 'MS_PLACEHOLDER',
-        'Dr.': 'DR_PLACEHOLDER',
-        'Prof.': 'PROF_PLACEHOLDER',
-        'Sr.': 'SR_PLACEHOLDER',
-        'Jr.': 'JR_PLACEHOLDER',
-        'Inc.': 'INC_PLACEHOLDER',
-        'Ltd.': 'LTD_PLACEHOLDER',
-        'Co.': 'CO_PLACEHOLDER',
-        'Corp.': 'CORP_PLACEHOLDER',
-        'etc.': 'ETC_PLACEHOLDER',
-        'vs.': 'VS_PLACEHOLDER',
-        'e.g.': 'EG_PLACEHOLDER',
-        'i.e.': 'IE_PLACEHOLDER',
-        'Ph.D.': 'PHD_PLACEHOLDER',
-        'M.D.': 'MD_PLACEHOLDER',
-    }
-    
-    for abbrev, placeholder in abbreviations.items():
-        protected = protected.replace(abbrev, placeholder)
-    
-    # Split on sentence-ending punctuation followed by space and capital letter
-    # Pattern: period/exclamation/question mark, then space(s), then capital or quote+capital
-    pattern = r'(?<=[.!?])\s+(?=[A-Z"\'])'
-    sentences = re.split(pattern, protected)
-    
-    # Restore abbreviations
-    restored_sentences = []
-    for sent in sentences:
-        for abbrev, placeholder in abbreviations.items():
-            sent = sent.replace(placeholder, abbrev)
-        if sent.strip():
-            restored_sentences.append(sent.strip())
-    
-    return restored_sentences
-
-
-def load_pdf_with_metadata() -> List[Document]:
-    """Load PDF and enrich with metadata from JSON"""
-    print("Loading PDF document...")
-    
-    # Load PDF
-    reader = PyMuPDFReader()
-    pdf_documents = reader.load(file_path=config.PDF_PATH)
-    
-    # Load metadata
-    with open(config.METADATA_PATH, 'r', encoding='utf-8') as f:
-        metadata_dict = json.load(f)
-    
-    # Enrich documents with metadata
-    enriched_docs = []
-    for i, doc in enumerate(pdf_documents, start=1):
-        page_key = f"page_{i}"
-        if page_key in metadata_dict:
-            meta = metadata_dict[page_key]
-            doc.metadata.update({
-                "page_number": meta["page_number"],
-                "header": meta["header"],
-                "involved_parties": ", ".join(meta["involved_parties"]),
-                "date": meta["date"],
-                "type": meta["type"],
-                "page_id": page_key
-            })
-            doc.id_ = page_key  # Set document ID for parent reference
-            enriched_docs.append(doc)
-    
-    print(f"[OK] Loaded {len(enriched_docs)} pages with metadata")
-    return enriched_docs
+    return [sent.strip() for sent in SENTENCE_SPLIT_RE.split(text) if sent.strip()]
+
+
+def pack_sentences(sentences: List[str]) -> List[Tuple[int, int]]:
+    """
+    Group consecutive sentences into chunks of at most CHUNK_SIZE characters.
+    
+    Each chunk after the first starts with the last complete sentences of the
+    previous chunk that fit in CHUNK_OVERLAP characters. A single sentence
+    longer than CHUNK_SIZE still gets a chunk of its own. Chunk lengths come
+    from prefix sums of the sentence lengths, and both boundaries are found
+    with a binary search instead of re-summing sentences.
+    
+    Returns:
+        (start, end) sentence index ranges, one per chunk; the last range is the tail
+    """
+    if not sentences:
+        return []
+    
+    # cum[i] = length of sentences[:i] joined with one space after each
+    cum = [0] + list(accumulate(len(sent) + 1 for sent in sentences))
+    n = len(sentences)
+    
+    ranges = []
+    start = 0
+    first_new = 0  # First sentence not in the previous chunk; always included
+    while True:
+        # Largest end with len(" ".join(sentences[start:end])) <= CHUNK_SIZE
+        end = bisect.bisect_right(cum, cum[start] + config.CHUNK_SIZE + 1) - 1
+        end = max(end, first_new + 1)
+        if end >= n:
+            ranges.append((start, n))
+            return ranges
+        ranges.append((start, end))
+        
+        # Overlap: trailing sentences of this chunk that fit in CHUNK_OVERLAP
+        start = max(start, bisect.bisect_left(cum, cum[end] - config.CHUNK_OVERLAP - 1))
+        first_new = end
+
+
+def _make_chunk_node(parent_doc: Document, chunk_sentences: List[str], chunk_index: int):
+    """Create a child node from complete sentences of a parent page"""
+    from llama_index.core.schema import TextNode
+    
+    chunk_text = " ".join(chunk_sentences)
+    node = TextNode(text=chunk_text)
+    node.metadata.update(parent_doc.metadata)
+    node.metadata["chunk_index"] = chunk_index
+    node.metadata["parent_id"] = parent_doc.id_
+    node.metadata["chunk_id"] = f"{parent_doc.id_}_chunk_{chunk_index}"
+    node.metadata["chunk_size"] = len(chunk_text)
+    node.metadata["num_sentences"] = len(chunk_sentences)
+    node.id_ = node.metadata["chunk_id"]
+    return node
+
+
+def _chunk_one_page(parent_doc: Document) -> tuple:
+    """
+    Split one page into sentence-aligned child nodes.
+    
+    Runs in a worker process when CHUNKING_PROCESSES > 1, so it returns what
+    should be reported instead of printing it.
+    
+    Returns:
+        (chunks, length of the merged tail chunk or None if nothing was merged)
+    """
+    # Process entire page as continuous text (respecting sentence boundaries)
+    # This allows overlap across paragraph boundaries
+    full_text = parent_doc.text
+    
+    # Split into sentences
+    sentences = split_into_sentences(full_text)
+    
+    # Complete sentences only; texts are joined once, when the nodes are built
+    chunk_sentences = [sentences[start:end] for start, end in pack_sentences(sentences)]
+    
+    # Check if the final chunk is a small tail and merge it with the previous one
+    merged_tail_length = None
+    if len(chunk_sentences) > 1:
+        tail = chunk_sentences[-1]
+        tail_length = sum(len(sent) for sent in tail) + len(tail) - 1
+        if tail_length < config.MIN_CHUNK_SIZE:
+            chunk_sentences.pop()
+            chunk_sentences[-1].extend(tail)
+            merged_tail_length = tail_length
+    
+    chunks = [_make_chunk_node(parent_doc, sents, chunk_index)
+              for chunk_index, sents in enumerate(chunk_sentences)]
+    return chunks, merged_tail_length
 
 
 def create_needle_chunks(documents: List[Document]) -> tuple:
@@ -108,9 +158,9 @@ def create_needle_chunks(documents: List[Document]) -> tuple:
     - Child nodes: Small chunks (300 chars with 40 overlap) - stored in vector store
     - Uses paragraph breaks (\n\n) as primary split points
     - ALWAYS splits at sentence boundaries (never mid-sentence)
+    - Pages are chunked in CHUNKING_PROCESSES worker processes when set above 1
     """
     print("\nCreating needle chunks with sentence-aware splitting...")
-    from llama_index.core.schema import TextNode
     
     # Create parent nodes (full pages)
     parent_nodes = []
@@ -118,85 +168,20 @@ def create_needle_chunks(documents: List[Document]) -> tuple:
         parent_nodes.append(doc)
         print(f"  Parent: {doc.metadata['page_id']} - {doc.metadata['header']}")
     
+    # Pages are independent, so they can be chunked in parallel (pure Python, CPU-bound).
+    # Workers are spawned, not forked: with PARALLEL_INDEXING the summary index is
+    # being built on another thread, and forking a multithreaded process can deadlock
+    if config.CHUNKING_PROCESSES > 1 and len(documents) > 1:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(min(config.CHUNKING_PROCESSES, len(documents))) as pool:
+            page_results = pool.map(_chunk_one_page, documents)
+    else:
+        page_results = [_chunk_one_page(parent_doc) for parent_doc in documents]
+    
     child_nodes = []
-    for parent_doc in documents:
-        # Process entire page as continuous text (respecting sentence boundaries)
-        # This allows overlap across paragraph boundaries
-        full_text = parent_doc.text
-        
-        # Split into sentences
-        sentences = split_into_sentences(full_text)
-        
-        chunks = []
-        current_chunk_sentences = []
-        current_chunk_length = 0
-        
-        for i, sent in enumerate(sentences):
-            sent = sent.strip()
-            if not sent:
-                continue
-            
-            # Calculate length if we add this sentence
-            potential_length = current_chunk_length + len(sent)
-            if current_chunk_sentences:  # Add space separator if not first sentence
-                potential_length += 1
-            
-            # Check if adding this sentence would exceed chunk size
-            if current_chunk_sentences and potential_length > config.CHUNK_SIZE:
-                # Finalize current chunk (complete sentences only)
-                chunk_text = " ".join(current_chunk_sentences)
-                node = TextNode(text=chunk_text)
-                node.metadata.update(parent_doc.metadata)
-                node.metadata["chunk_index"] = len(chunks)
-                node.metadata["parent_id"] = parent_doc.id_
-                node.metadata["chunk_id"] = f"{parent_doc.id_}_chunk_{len(chunks)}"
-                node.metadata["chunk_size"] = len(chunk_text)
-                node.metadata["num_sentences"] = len(current_chunk_sentences)
-                node.id_ = node.metadata["chunk_id"]
-                chunks.append(node)
-                
-                # Create overlap: include last 1-2 complete sentences from previous chunk
-                overlap_sentences = []
-                overlap_length = 0
-                for prev_sent in reversed(current_chunk_sentences):
-                    if overlap_length + len(prev_sent) <= config.CHUNK_OVERLAP:
-                        overlap_sentences.insert(0, prev_sent)
-                        overlap_length += len(prev_sent) + 1  # +1 for space
-                    else:
-                        break
-                
-                # Start new chunk with overlap + current sentence
-                current_chunk_sentences = overlap_sentences + [sent]
-                current_chunk_length = sum(len(s) for s in current_chunk_sentences) + len(current_chunk_sentences) - 1
-            else:
-                # Add sentence to current chunk
-                current_chunk_sentences.append(sent)
-                current_chunk_length = potential_length
-        
-        # Add the final chunk (if any sentences remain)
-        if current_chunk_sentences:
-            chunk_text = " ".join(current_chunk_sentences)
-            
-            # Check if this is a small tail chunk and merge with previous if needed
-            if len(chunks) > 0 and len(chunk_text) < config.MIN_CHUNK_SIZE:
-                # Merge with the previous chunk
-                prev_chunk = chunks[-1]
-                merged_text = prev_chunk.text + " " + chunk_text
-                prev_chunk.text = merged_text
-                prev_chunk.metadata["chunk_size"] = len(merged_text)
-                prev_chunk.metadata["num_sentences"] += len(current_chunk_sentences)
-                print(f"     ✓ Merged small tail chunk ({len(chunk_text)} chars) with previous chunk")
-            else:
-                # Create new chunk
-                node = TextNode(text=chunk_text)
-                node.metadata.update(parent_doc.metadata)
-                node.metadata["chunk_index"] = len(chunks)
-                node.metadata["parent_id"] = parent_doc.id_
-                node.metadata["chunk_id"] = f"{parent_doc.id_}_chunk_{len(chunks)}"
-                node.metadata["chunk_size"] = len(chunk_text)
-                node.metadata["num_sentences"] = len(current_chunk_sentences)
-                node.id_ = node.metadata["chunk_id"]
-                chunks.append(node)
+    for parent_doc, (chunks, merged_tail_length) in zip(documents, page_results):
+        if merged_tail_length is not None:
+            print(f"     ✓ Merged small tail chunk ({merged_tail_length} chars) with previous chunk")
         
         child_nodes.extend(chunks)
         
@@ -218,14 +203,69 @@ def create_needle_chunks(documents: List[Document]) -> tuple:
     return parent_nodes, child_nodes
 
 
+def embed_nodes(nodes: List[Document], embed_model) -> List[List[float]]:
+    """
+    Embed node texts in batches of EMBEDDING_BATCH_SIZE (one API request per batch)
+    and attach each vector to its node, so VectorStoreIndex doesn't embed them again.
+    Texts already in the embedding cache are not sent to the API, repeated
+    texts (page boilerplate) are embedded once, and up to EMBEDDING_MAX_WORKERS
+    batch requests are in flight at once.
+    """
+    texts = [node.text for node in nodes]
+    cache = EmbeddingCache(config.EMBEDDING_CACHE_PATH, config.EMBEDDING_MODEL)
+    try:
+        embeddings = cache.get_many(texts)
+        
+        # Node indices of each distinct uncached text
+        missing = {}
+        for i, embedding in enumerate(embeddings):
+            if embedding is None:
+                missing.setdefault(texts[i], []).append(i)
+        unique_texts = list(missing)
+        batches = [unique_texts[start:start + config.EMBEDDING_BATCH_SIZE]
+                   for start in range(0, len(unique_texts), config.EMBEDDING_BATCH_SIZE)]
+        
+        # Requests run in worker threads; the SQLite cache is only touched from this one
+        done = 0
+        with ThreadPoolExecutor(max_workers=max(1, config.EMBEDDING_MAX_WORKERS)) as executor:
+            results = executor.map(embed_model.get_text_embedding_batch, batches)
+            for batch, batch_embeddings in zip(batches, results):
+                cache.put_many(batch, batch_embeddings)
+                for text, embedding in zip(batch, batch_embeddings):
+                    for i in missing[text]:
+                        embeddings[i] = embedding
+                done += len(batch)
+                print(f"  Embedded {done}/{len(unique_texts)} unique uncached chunks...")
+        
+        cache.print_stats()
+    finally:
+        cache.close()
+    
+    for node, embedding in zip(nodes, embeddings):
+        node.embedding = embedding
+    return embeddings
+
+
+def _vector_literal(embedding: List[float]) -> str:
+    """
+    Format an embedding in pgvector's '[x,y,...]' text form.
+    
+    pgvector stores float32, so values are rounded to float32 first and
+    written with 9 significant digits (enough to round-trip a float32
+    exactly) instead of Python's 17-digit float64 repr.
+    """
+    return "[" + ",".join(map("{:.9g}".format, np.asarray(embedding, dtype=np.float32).tolist())) + "]"
+
+
 def store_via_postgres(child_nodes: List[Document], parent_nodes: List[Document], docstore) -> tuple:
     """
     Store chunks using direct PostgreSQL connection (fallback when REST API fails)
     """
     import psycopg2
+    import csv
+    import io
     import json
     import re
-    from llama_index.embeddings.openai import OpenAIEmbedding
     from llama_index.core import VectorStoreIndex, StorageContext
     
     print("\n⚠ Using direct PostgreSQL insertion (REST API not ready)...")
@@ -251,38 +291,73 @@ def store_via_postgres(child_nodes: List[Document], parent_nodes: List[Document]
     )
     
     cursor = conn.cursor()
-    embed_model = OpenAIEmbedding(model=config.EMBEDDING_MODEL, api_key=config.OPENAI_API_KEY)
-    
-    print(f"Generating embeddings and storing {len(child_nodes)} chunks via PostgreSQL...")
     
-    for i, node in enumerate(child_nodes):
-        # Generate embedding
-        embedding = embed_model.get_text_embedding(node.text)
-        
-        # Insert directly into PostgreSQL
-        cursor.execute(f"""
-            INSERT INTO {config.CHUNKS_TABLE} 
-            (chunk_id, content, embedding, metadata, page_number, chunk_index, parent_id)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (chunk_id) DO UPDATE SET
-                content = EXCLUDED.content,
-                embedding = EXCLUDED.embedding,
-                metadata = EXCLUDED.metadata,
-                page_number = EXCLUDED.page_number,
-                chunk_index = EXCLUDED.chunk_index,
-                parent_id = EXCLUDED.parent_id;
-        """, (
+    # Embeddings are already attached when falling back from store_in_supabase
+    if any(node.embedding is None for node in child_nodes):
+        print(f"Generating embeddings for {len(child_nodes)} chunks...")
+        embed_nodes(child_nodes, EMBED_MODEL)
+    
+    print(f"Storing {len(child_nodes)} chunks via PostgreSQL...")
+    
+    # Chunk metadata is the parent page's metadata plus these per-chunk fields,
+    # so the page part is serialized once per page and the server adds the rest
+    chunk_keys = ("chunk_index", "parent_id", "chunk_id", "chunk_size", "num_sentences")
+    page_metadata_json = {}
+    
+    # Serialize all rows as CSV (vectors in pgvector's '[x,y,...]' text form);
+    # QUOTE_NONNUMERIC keeps empty strings distinct from NULL
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+    for node in child_nodes:
+        parent_id = node.metadata["parent_id"]
+        if parent_id not in page_metadata_json:
+            page_metadata_json[parent_id] = json.dumps(
+                {key: value for key, value in node.metadata.items() if key not in chunk_keys}
+            )
+        writer.writerow([
             node.metadata["chunk_id"],
             node.text,
-            embedding,
-            json.dumps(node.metadata),
+            _vector_literal(node.embedding),
+            page_metadata_json[parent_id],
             node.metadata["page_number"],
             node.metadata["chunk_index"],
-            node.metadata["parent_id"]
-        ))
-        
-        if (i + 1) % 5 == 0 or (i + 1) == len(child_nodes):
-            print(f"  Stored {i + 1}/{len(child_nodes)} chunks...")
+            parent_id,
+            node.metadata["chunk_size"],
+            node.metadata["num_sentences"]
+        ])
+    buffer.seek(0)
+    
+    # COPY into a staging table, then upsert everything in one statement
+    columns = "chunk_id, content, embedding, metadata, page_number, chunk_index, parent_id"
+    cursor.execute(f"""
+        CREATE TEMP TABLE chunks_staging (LIKE {config.CHUNKS_TABLE}) ON COMMIT DROP;
+        ALTER TABLE chunks_staging ADD COLUMN chunk_size INTEGER, ADD COLUMN num_sentences INTEGER;
+    """)
+    cursor.copy_expert(
+        f"COPY chunks_staging ({columns}, chunk_size, num_sentences) FROM STDIN WITH (FORMAT csv)",
+        buffer
+    )
+    cursor.execute(f"""
+        INSERT INTO {config.CHUNKS_TABLE} ({columns})
+        SELECT
+            chunk_id, content, embedding,
+            metadata || jsonb_build_object(
+                'chunk_index', chunk_index,
+                'parent_id', parent_id,
+                'chunk_id', chunk_id,
+                'chunk_size', chunk_size,
+                'num_sentences', num_sentences
+            ),
+            page_number, chunk_index, parent_id
+        FROM chunks_staging
+        ON CONFLICT (chunk_id) DO UPDATE SET
+            content = EXCLUDED.content,
+            embedding = EXCLUDED.embedding,
+            metadata = EXCLUDED.metadata,
+            page_number = EXCLUDED.page_number,
+            chunk_index = EXCLUDED.chunk_index,
+            parent_id = EXCLUDED.parent_id;
+    """)
     
     conn.commit()
     cursor.close()
@@ -325,15 +400,11 @@ def store_in_supabase(child_nodes: List[Document], parent_nodes: List[Document])
     
     # Generate embeddings and store chunks
     print(f"Generating embeddings for {len(child_nodes)} chunks...")
-    from llama_index.embeddings.openai import OpenAIEmbedding
-    embed_model = OpenAIEmbedding(model=config.EMBEDDING_MODEL, api_key=config.OPENAI_API_KEY)
+    embeddings = embed_nodes(child_nodes, EMBED_MODEL)
     
-    for i, node in enumerate(child_nodes):
-        # Generate embedding
-        embedding = embed_model.get_text_embedding(node.text)
-        
-        # Prepare data for Supabase
-        data = {
+    # Prepare data for Supabase
+    rows = [
+        {
             "chunk_id": node.metadata["chunk_id"],
             "content": node.text,
             "embedding": embedding,
@@ -342,11 +413,16 @@ def store_in_supabase(child_nodes: List[Document], parent_nodes: List[Document])
             "chunk_index": node.metadata["chunk_index"],
             "parent_id": node.metadata["parent_id"]
         }
+        for node, embedding in zip(child_nodes, embeddings)
+    ]
+    
+    for start in range(0, len(rows), config.CHUNK_UPSERT_BATCH_SIZE):
+        batch = rows[start:start + config.CHUNK_UPSERT_BATCH_SIZE]
         
-        # Upsert into Supabase (insert or update if exists based on chunk_id)
+        # Upsert into Supabase (insert or update if exists based on chunk_id), one request per batch
         try:
             result = supabase.table(config.CHUNKS_TABLE).upsert(
-                data,
+                batch,
                 on_conflict="chunk_id"  # Update if chunk_id already exists
             ).execute()
             
@@ -354,10 +430,9 @@ def store_in_supabase(child_nodes: List[Document], parent_nodes: List[Document])
             if not result.data:
                 raise Exception(f"Insertion returned empty data - table may not be recognized by REST API")
             
-            if (i + 1) % 5 == 0 or (i + 1) == len(child_nodes):
-                print(f"  Stored {i + 1}/{len(child_nodes)} chunks...")
+            print(f"  Stored {start + len(batch)}/{len(rows)} chunks...")
         except Exception as e:
-            print(f"\n✗ Error storing chunk {i + 1}: {e}")
+            print(f"\n✗ Error storing chunks {start + 1}-{start + len(batch)}: {e}")
             print("\nThe Supabase REST API hasn't recognized the table yet.")
             print("Switching to direct PostgreSQL insertion method...")
             
@@ -384,8 +459,13 @@ def store_in_supabase(child_nodes: List[Document], parent_nodes: List[Document])
     return index, docstore
 
 
-def create_needle_index():
-    """Main function to create needle index with auto-merge capability"""
+def create_needle_index(pages: List[Document] = None):
+    """
+    Main function to create needle index with auto-merge capability
+    
+    Args:
+        pages: Page documents from load_pdf_with_metadata (loaded here if None)
+    """
     print("=" * 70)
     print("NEEDLE INDEXING - Needle-in-a-Haystack System")
     print("=" * 70)
@@ -435,8 +515,8 @@ def create_needle_index():
         # Validate configuration
         config.validate_config()
         
-        # Load documents
-        documents = load_pdf_with_metadata()
+        # Load documents (unless the caller already loaded them)
+        documents = pages if pages is not None else load_pdf_with_metadata()
         
         # Create needle chunks structure
         parent_nodes, child_nodes = create_needle_chunks(documents)
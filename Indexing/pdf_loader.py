@@ -0,0 +1,91 @@
+"""
+PDF Loader for the Indexing System
+Loads the claim PDF once as one document per page, enriched with metadata from JSON
+"""
+
+import json
+import pickle
+from pathlib import Path
+from typing import List
+from llama_index.core import Document
+from llama_index.readers.file import PyMuPDFReader
+
+from Config import config
+
+
+def load_pdf_documents(use_cache: bool = True) -> List[Document]:
+    """
+    Extract the PDF with PyMuPDF, one document per page.
+    
+    Extraction is the slow part of a cold rebuild, so the raw page documents
+    are pickled under PDF_CACHE_DIR, keyed by the PDF's size and modification
+    time, and reused until the file changes.
+    
+    Args:
+        use_cache: Reuse (and store) the extracted pages
+    """
+    stat = Path(config.PDF_PATH).stat()
+    cache_path = Path(config.PDF_CACHE_DIR) / f"{stat.st_size}_{stat.st_mtime_ns}.pkl"
+    
+    if use_cache and cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                pdf_documents = pickle.load(f)
+            print(f"[CACHE] Loaded {len(pdf_documents)} extracted PDF pages")
+            return pdf_documents
+        except Exception as e:
+            print(f"[WARNING] Could not load extracted PDF pages: {e}")
+    
+    reader = PyMuPDFReader()
+    pdf_documents = reader.load(file_path=config.PDF_PATH)
+    
+    if use_cache:
+        # Pages extracted from older versions of the PDF are never read again
+        for stale_path in cache_path.parent.glob("*.pkl"):
+            stale_path.unlink()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(pdf_documents, f, protocol=5)
+    
+    return pdf_documents
+
+
+def load_pdf_with_metadata(use_cache: bool = True) -> List[Document]:
+    """
+    Load PDF pages and enrich them with metadata from JSON.
+    
+    The same page documents are used by both the needle and summary indexes
+    (neither modifies them), so create_all_indexes loads them once and passes
+    them to both builders.
+    
+    Args:
+        use_cache: Reuse PDF pages extracted by an earlier run (see load_pdf_documents)
+    """
+    print("Loading PDF document...")
+    
+    # Load PDF
+    pdf_documents = load_pdf_documents(use_cache)
+    
+    # Load metadata
+    with open(config.METADATA_PATH, 'r', encoding='utf-8') as f:
+        metadata_dict = json.load(f)
+    
+    # Enrich documents with metadata
+    enriched_docs = []
+    for i, doc in enumerate(pdf_documents, start=1):
+        page_key = f"page_{i}"
+        if page_key in metadata_dict:
+            meta = metadata_dict[page_key]
+            doc.metadata.update({
+                "page_number": meta["page_number"],
+                "header": meta["header"],
+                "involved_parties": ", ".join(meta["involved_parties"]),
+                "date": meta["date"],
+                "type": meta["type"],
+                "page_id": page_key
+            })
+            doc.id_ = page_key  # Set document ID for parent reference
+            enriched_docs.append(doc)
+    
+    print(f"[OK] Loaded {len(enriched_docs)} pages with metadata")
+    return enriched_docs
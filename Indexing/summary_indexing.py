@@ -3,51 +3,26 @@ Summary Indexing System
 Creates one summary chunk per page and stores in Supabase vector store
 """
 
-import json
 from typing import List
 from llama_index.core import Document, VectorStoreIndex, StorageContext, Settings
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.llms.openai import OpenAI
-from llama_index.readers.file import PyMuPDFReader
 from supabase import create_client, Client
 
 # Handle imports for both module execution and direct script execution
 from Config import config
 
+try:
+    from Indexing.pdf_loader import load_pdf_with_metadata
+except ModuleNotFoundError:
+    from pdf_loader import load_pdf_with_metadata
+
 # Configure LlamaIndex settings
 Settings.llm = OpenAI(model=config.SUMMARY_MODEL, temperature=config.TEMPERATURE, api_key=config.OPENAI_API_KEY)
-Settings.embed_model = OpenAIEmbedding(model=config.EMBEDDING_MODEL, api_key=config.OPENAI_API_KEY)
 
-
-def load_pdf_pages() -> List[Document]:
-    """Load PDF pages as separate documents"""
-    print("Loading PDF document...")
-    
-    reader = PyMuPDFReader()
-    pdf_documents = reader.load(file_path=config.PDF_PATH)
-    
-    # Load metadata
-    with open(config.METADATA_PATH, 'r', encoding='utf-8') as f:
-        metadata_dict = json.load(f)
-    
-    # Enrich with metadata
-    enriched_docs = []
-    for i, doc in enumerate(pdf_documents, start=1):
-        page_key = f"page_{i}"
-        if page_key in metadata_dict:
-            meta = metadata_dict[page_key]
-            doc.metadata.update({
-                "page_number": meta["page_number"],
-                "header": meta["header"],
-                "involved_parties": ", ".join(meta["involved_parties"]),
-                "date": meta["date"],
-                "type": meta["type"],
-                "page_id": page_key
-            })
-            enriched_docs.append(doc)
-    
-    print(f"[OK] Loaded {len(enriched_docs)} pages")
-    return enriched_docs
+# One embedding client (and HTTP connection pool) shared by indexing and storage
+EMBED_MODEL = OpenAIEmbedding(model=config.EMBEDDING_MODEL, api_key=config.OPENAI_API_KEY)
+Settings.embed_model = EMBED_MODEL
 
 
 def generate_summary_for_page(page_doc: Document, llm: OpenAI) -> str:
@@ -151,12 +126,10 @@ def store_summaries_in_supabase(summary_docs: List[Document]) -> VectorStoreInde
     
     # Generate embeddings and store summaries
     print(f"Generating embeddings for {len(summary_docs)} summaries...")
-    from llama_index.embeddings.openai import OpenAIEmbedding
-    embed_model = OpenAIEmbedding(model=config.EMBEDDING_MODEL, api_key=config.OPENAI_API_KEY)
     
     for i, doc in enumerate(summary_docs):
         # Generate embedding
-        embedding = embed_model.get_text_embedding(doc.text)
+        embedding = EMBED_MODEL.get_text_embedding(doc.text)
         
         # Prepare data for Supabase
         data = {
@@ -198,8 +171,13 @@ def store_summaries_in_supabase(summary_docs: List[Document]) -> VectorStoreInde
     return index
 
 
-def create_summary_index():
-    """Main function to create summary index"""
+def create_summary_index(pages: List[Document] = None):
+    """
+    Main function to create summary index
+    
+    Args:
+        pages: Page documents from load_pdf_with_metadata (loaded here if None)
+    """
     print("=" * 70)
     print("SUMMARY INDEXING - High-Level Query System")
     print("=" * 70)
@@ -249,8 +227,8 @@ def create_summary_index():
         # Validate configuration
         config.validate_config()
         
-        # Load PDF pages
-        documents = load_pdf_pages()
+        # Load PDF pages (unless the caller already loaded them)
+        documents = pages if pages is not None else load_pdf_with_metadata()
         
         # Generate summaries for each page
         summary_docs = create_summary_chunks(documents)